@@ -24,3 +24,9 @@ PINECONE_CONFIG = {
 GOOGLE_CONFIG = {
     'api_key': os.getenv('GOOGLE_API_KEY')
 }
+
+# Daily Pipeline Configuration
+PIPELINE_CONFIG = {
+    'scraper_workers': int(os.getenv('SCRAPER_WORKERS', '8')),
+    'scraper_timeout': int(os.getenv('SCRAPER_TIMEOUT', '900'))  # seconds per scraper
+}
@@ -1,14 +1,14 @@
 import os
 import sys
-import json
 import logging
-from datetime import datetime, timezone
+import threading
+from datetime import date, datetime, timezone
 from dotenv import load_dotenv
 from tqdm import tqdm
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from pinecone import Pinecone, ServerlessSpec
-from pathlib import Path
 from neo4j import GraphDatabase
+from neo4j.exceptions import AuthError, ClientError, Forbidden
 
 
 # ------------------------------- Load environment variables -------------------------------
@@ -22,6 +22,14 @@ PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 from configuration import NEO4J_CONFIG
+from data.graph_schema import ensure_schema
+from daily_news_pipeline.news_scrapers.article_store import get_article_store
+from daily_news_pipeline.news_scrapers.canonical_urls import canonical_url
+from daily_news_pipeline.data_uploder.near_duplicates import mark_duplicates
+from daily_news_pipeline.data_uploder.batch_embedder import iter_embeddings
+from daily_news_pipeline.data_uploder.pinecone_upserter import PineconeUpserter, delete_vectors
+from daily_news_pipeline.data_uploder.sync_manifest import content_hash, get_sync_manifest
+from daily_news_pipeline.data_uploder.chunker import chunk_article
 
 
 # ------------------------------- Logging Setup ------------------------------- 
@@ -35,54 +43,15 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-# ------------------------------- Load JSON File -------------------------------
-# G:\16-07-2025\New_News_Rag_App_V2\daily_news_pipeline\news_scrapers\news_articles_data\news_articles_data.json
-# INPUT_JSON = Path("news_scrapers/news_articles_data/news_articles_data.json")
-
-BASE_DIR = Path(__file__).resolve().parent.parent  # Go from data_uploder/ to daily_news_pipeline/
-INPUT_JSON = BASE_DIR / "news_scrapers" / "news_articles_data" / "news_articles_scrap_data.json"
-
-print(f"Loading JSON from: {INPUT_JSON}")
-
-
-def load_json_data(file_path):
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            articles = json.load(f)
-        logger.info(f"Loaded {len(articles)} articles from {file_path}")
-        return articles
-    except FileNotFoundError:
-        logger.error(f"File not found: {file_path}")
-        return []
-    except json.JSONDecodeError as e:
-        logger.error(f"Error decoding JSON from {file_path}: {e}")
-        return []
-    except Exception as e:
-        logger.error(f"An unexpected error occurred while loading JSON from {file_path}: {e}")
-        return []
-
-articless = load_json_data(INPUT_JSON)
-
-
 # ------------------------------- Filter Articles Published Today -------------------------------
 
-def filter_today_articles(articless):
-    today_str = datetime.today().strftime("%d-%m-%Y")
-    today_articles = []
-
-    for article in articless:
-        pub_date = article.get("publication_date", "").strip()
-        if pub_date == today_str:
-            today_articles.append(article)
-
-    logger.info(f"Filtered {len(today_articles)} articles published today ({today_str}).")
+def filter_today_articles():
+    today = date.today()
+    today_articles = get_article_store().articles_published_on(today)
+    logger.info(f"Filtered {len(today_articles)} articles published today ({today.isoformat()}).")
     return today_articles
 
 
-# Replace articles with filtered articles
-articles = filter_today_articles(articless)
-
-
 # ------------------------------- Upload to Neo4j -------------------------------
 
 def parse_date(date_str):
@@ -95,67 +64,177 @@ def parse_date(date_str):
         logger.error(f"Unexpected error parsing date '{date_str}': {e}")
         return "1970-01-01"
 
-def insert_article_neo4j(tx, article):
+NEO4J_BATCH_SIZE = int(os.getenv("NEO4J_BATCH_SIZE", "500"))  # Articles per UNWIND transaction
+
+# One statement per batch; rows run in order, so a canonical article is
+# merged before a duplicate later in the same batch links to it
+UPSERT_ARTICLES = """
+    UNWIND $rows AS row
+    MERGE (a:Article {title: row.title})
+    SET a.description = row.description,
+        a.publication_date = date(row.publication_date),
+        a.full_text = row.full_text
+
+    MERGE (au:Author {name: row.author})
+    MERGE (u:URL {url: row.source_url})
+
+    MERGE (au)-[:WROTE]->(a)
+    MERGE (a)-[:HAS_URL]->(u)
+
+    WITH a, row
+    WHERE row.duplicate_of IS NOT NULL
+    MATCH (c:Article)-[:HAS_URL]->(:URL {url: row.duplicate_of})
+    WHERE c <> a
+    MERGE (a)-[:DUPLICATE_OF]->(c)
+"""
+
+
+def article_row(article):
+    """Query parameters for one article."""
+    return {
+        "title": article.get("title", "Untitled"),
+        "description": article.get("description", ""),
+        "publication_date": parse_date(article.get("publication_date", "")),
+        "author": article.get("author", "Unknown"),
+        "source_url": canonical_url(article.get("source_url", "")),
+        "full_text": article.get("description", ""),
+        "duplicate_of": canonical_url(article["duplicate_of"]) if article.get("duplicate_of") else None,
+    }
+
+
+def insert_articles_neo4j(tx, rows):
+    tx.run(UPSERT_ARTICLES, rows=rows).consume()
+
+
+def _write_rows(session, rows, failed):
+    """
+    Writes rows in one transaction. If Neo4j rejects the batch's data
+    (a ClientError), it is split in halves until the failing rows are
+    isolated and added to `failed`. Transient, database, auth and connection
+    errors say nothing about the rows, so they propagate and fail the batch
+    as a unit. Returns the number of rows written.
+    """
     try:
-        tx.run("""
-            MERGE (a:Article {title: $title})
-            SET a.description = $description,
-                a.publication_date = date($publication_date),
-                a.full_text = $full_text
-
-            MERGE (au:Author {name: $author})
-            MERGE (u:URL {url: $source_url})
-
-            MERGE (au)-[:WROTE]->(a)
-            MERGE (a)-[:HAS_URL]->(u)
-        """, {
-            "title": article.get("title", "Untitled"),
-            "description": article.get("description", ""),
-            "publication_date": parse_date(article.get("publication_date", "")),
-            "author": article.get("author", "Unknown"),
-            "source_url": article.get("source_url", ""),
-            "full_text": article.get("description", "")
-        })
-        logger.debug(f"[Neo4j] Inserted: {article.get('title', 'Untitled')}") # Added debug level
-    except Exception as e:
-        logger.error(f"[Neo4j] Failed to insert article (Title: {article.get('title', 'Untitled')}).  Error: {e}")
-        raise  
-
-def upload_to_neo4j(articles):
-    driver = None
+        session.execute_write(insert_articles_neo4j, rows)
+        return len(rows)
+    except ClientError as e:
+        if isinstance(e, (AuthError, Forbidden)):
+            raise
+        if len(rows) == 1:
+            failed.append({"source_url": rows[0]["source_url"], "title": rows[0]["title"], "error": str(e)})
+            logger.error(f"[Neo4j] Failed to insert article (Title: {rows[0]['title']}). Error: {e}")
+            return 0
+        middle = len(rows) // 2
+        return _write_rows(session, rows[:middle], failed) + _write_rows(session, rows[middle:], failed)
+
+
+def upload_to_neo4j(articles, batch_size=NEO4J_BATCH_SIZE, manifest=None, force=False):
+    """
+    Merges articles into Neo4j in batches of `batch_size`, one UNWIND
+    transaction per batch. Articles whose row is unchanged since the sync
+    manifest last recorded it are skipped, unless `force` is set. Returns
+    {"uploaded": count, "skipped": count, "failed": [{source_url, title,
+    error}]}. Articles without a title or URL are reported as failed instead
+    of being merged into one shared node.
+    """
+    rows, failed = [], []
+    for article in articles:
+        row = article_row(article)
+        if not row["title"] or not row["source_url"]:
+            failed.append({"source_url": row["source_url"], "title": row["title"], "error": "missing title or source URL"})
+        else:
+            rows.append(row)
+
+    total, uploaded, skipped = len(rows) + len(failed), 0, 0
+    manifest = manifest or get_sync_manifest()
+    hashes = {row["source_url"]: content_hash(row) for row in rows}
+    if manifest and not force:
+        synced = manifest.neo4j_hashes(hashes)
+        changed = [row for row in rows if synced.get(row["source_url"]) != hashes[row["source_url"]]]
+        skipped, rows = len(rows) - len(changed), changed
+    if not rows:
+        logger.info(f"[Neo4j] Nothing to upsert, {skipped} articles unchanged, {len(failed)} failed.")
+        return {"uploaded": 0, "skipped": skipped, "failed": failed}
+
+    driver, written = None, 0
     try:
         driver = GraphDatabase.driver(
             NEO4J_CONFIG["uri"],
-            auth=(NEO4J_CONFIG["user"], NEO4J_CONFIG["password"])
+            auth=(NEO4J_CONFIG["username"], NEO4J_CONFIG["password"])
         )
-        with driver.session() as session:
-            for article in articles:
-                try:
-                    session.execute_write(insert_article_neo4j, article)
-                except Exception as e:
-                    logger.error(f"[Neo4j] Error during Neo4j session: {e}")
-                    
+        ensure_schema(driver)  # MERGE keys must be indexed, or every row is a label scan
+        with driver.session(database=NEO4J_CONFIG.get("database")) as session:
+            for i in tqdm(range(0, len(rows), batch_size), desc="Upserting to Neo4j"):
+                batch, failed_before = rows[i:i + batch_size], len(failed)
+                uploaded += _write_rows(session, batch, failed)
+                written = i + len(batch)
+                if manifest:
+                    rejected = {entry["source_url"] for entry in failed[failed_before:]}
+                    manifest.mark_neo4j([
+                        (row["source_url"], hashes[row["source_url"]]) for row in batch if row["source_url"] not in rejected
+                    ])
     except Exception as e:
         logger.critical(f"[Neo4j] Connection error: {e}")  # Catch connection level errors
+        # Rows not yet written fail with the batch; nothing is known against them individually
+        failed.extend({"source_url": row["source_url"], "title": row["title"], "error": str(e)} for row in rows[written:])
     finally:
         if driver:
             driver.close()
         logger.info("Neo4j connection closed.")
 
+    logger.info(f"[Neo4j] Upserted {uploaded} of {total} articles, {skipped} unchanged, {len(failed)} failed.")
+    return {"uploaded": uploaded, "skipped": skipped, "failed": failed}
+
 
 # ------------------------------- Chunk + Embed + Upsert to Pinecone -------------------------------
 
-embedding_model = GoogleGenerativeAIEmbeddings(model="models/text-embedding-004")
-pc = Pinecone(api_key=PINECONE_API_KEY)
 index_name = "news-data-index"
-MAX_CHARS = 1000
-BATCH_SIZE = 100
+
+
+# ------------------------------- Lazy Resources -------------------------------
+# Clients are created on first use, so importing this module (the API does,
+# through the daily pipeline) costs no network calls.
+
+_embedding_model = None
+_pinecone = None
+_index = None
+_resource_lock = threading.Lock()
+
+
+def get_embedding_model():
+    """Returns the shared embedding client, creating it on first use."""
+    global _embedding_model
+    with _resource_lock:
+        if _embedding_model is None:
+            _embedding_model = GoogleGenerativeAIEmbeddings(model="models/text-embedding-004")
+        return _embedding_model
+
+
+def get_pinecone_client():
+    global _pinecone
+    with _resource_lock:
+        if _pinecone is None:
+            _pinecone = Pinecone(api_key=PINECONE_API_KEY)
+        return _pinecone
+
+
+def get_pinecone_index():
+    """Returns the shared Pinecone index, or None if it cannot be reached (retried on the next call)."""
+    global _index
+    if _index is None:
+        index = initialize_pinecone_index(index_name)
+        with _resource_lock:
+            if _index is None:
+                _index = index
+    return _index
 
 
 # ------------------------------- Pinecone Index Handling -------------------------------
 
-def initialize_pinecone_index(index_name, dimension=768, metric="cosine", spec=ServerlessSpec(cloud="aws", region="us-east-1")):
+def initialize_pinecone_index(index_name, dimension=768, metric="cosine", spec=None):
+    spec = spec or ServerlessSpec(cloud="aws", region="us-east-1")
     try:
+        pc = get_pinecone_client()
         if index_name not in [i.name for i in pc.list_indexes()]:
             pc.create_index(name=index_name, dimension=dimension, metric=metric, spec=spec)
             logger.info(f"Created Pinecone index: {index_name}")
@@ -167,61 +246,124 @@ def initialize_pinecone_index(index_name, dimension=768, metric="cosine", spec=S
         return None  # Indicate failure
 
 
-index = initialize_pinecone_index(index_name)
-
-def chunk_text(text, max_chars):
-    return [text[i:i + max_chars] for i in range(0, len(text), max_chars)]
+def article_vectors(article):
+    """
+    (vector id, text to embed, metadata) for each chunk of an article. Near-
+    duplicates, empty bodies and articles without a URL have none.
+    """
+    description = article.get("description", "").strip()
+    source_url = canonical_url(article.get("source_url", ""))
+    if not description or not source_url or article.get("duplicate_of"):
+        return []
 
-def embed_and_upsert(articles):
+    records = []
+    for chunk in chunk_article(article):
+        metadata = {
+            "title": article.get("title", ""),
+            "author": article.get("author", ""),
+            "publication_date": article.get("publication_date", ""),
+            "url": source_url,
+            "chunk_index": chunk.index,
+            "chunk_text": chunk.text
+        }
+        records.append((f"{source_url}#chunk-{chunk.index}", chunk.content, metadata))
+    return records
+
+
+def embed_and_upsert(articles, manifest=None, force=False):
+    """
+    Chunks, embeds and upserts the articles as one stream: chunks are read as
+    the embedder needs them, and each vector goes to the upserter as soon as
+    its batch is embedded.
+
+    Articles whose chunks are unchanged since the sync manifest last recorded
+    them are skipped, unless `force` is set. Once a changed article is fully
+    upserted, the chunk ids it no longer produces are deleted. Returns
+    {"upserted", "failed", "requests", "skipped", "deleted"}, or None if the
+    index is unavailable.
+    """
+    index = get_pinecone_index()
     if index is None:
         logger.warning("Skipping Pinecone upload due to index initialization failure.")
-        return
-
-    vectors = []
-    for article in tqdm(articles, desc="Embedding & Chunking"):
-        description = article.get("description", "").strip()
-        if not description:
+        return None
+
+    # Near-duplicates are already searchable through their canonical article
+    duplicates = sum(1 for article in articles if article.get("duplicate_of"))
+    if duplicates:
+        logger.info(f"[Pinecone] Skipping {duplicates} near-duplicate articles.")
+
+    manifest = manifest or get_sync_manifest()
+    model = get_embedding_model()
+    model_name = getattr(model, "model", type(model).__name__)
+    changes = {}  # source_url -> (content hash, vector ids now, vector ids written before)
+    pending = {}  # position -> (vector id, metadata), only for chunks still being embedded
+    unembedded = set()
+    skipped = 0
+
+    def contents():
+        nonlocal skipped
+        position = 0
+        for article in articles:
+            source_url = canonical_url(article.get("source_url", ""))
+            if not source_url:
+                continue
+            records = article_vectors(article)
+            digest = content_hash([model_name, records])
+            previous = manifest.vector_state(source_url) if manifest else None
+            if previous and previous[0] == digest and not force:
+                skipped += 1
+                continue
+            changes[source_url] = (digest, {doc_id for doc_id, _, _ in records}, previous[1] if previous else set())
+            for doc_id, content, metadata in records:
+                pending[position] = (doc_id, metadata)
+                position += 1
+                yield content
+
+    with PineconeUpserter(index) as upserter:
+        for position, embedding in tqdm(iter_embeddings(model, contents()), desc="Embedding + upserting", unit="chunk"):
+            doc_id, metadata = pending.pop(position)
+            if embedding is None:
+                logger.error(f"[Pinecone] Embedding failed for chunk {doc_id}")
+                unembedded.add(doc_id)
+                continue
+            upserter.add({"id": doc_id, "values": embedding, "metadata": metadata})
+
+    # Stale ids are deleted only once every chunk of the new version is in the index
+    failed_ids, deleted = set(upserter.failed_ids) | unembedded, 0
+    for source_url, (digest, ids, previous) in changes.items() if manifest else ():
+        if ids & failed_ids:
+            manifest.mark_vectors(source_url, None, previous | (ids - failed_ids))
             continue
+        stale = previous - ids
+        if stale and not delete_vectors(index, stale):
+            manifest.mark_vectors(source_url, None, ids | stale)
+            continue
+        deleted += len(stale)
+        manifest.mark_vectors(source_url, digest, ids)
 
-        chunks = chunk_text(description, MAX_CHARS)
-        for idx, chunk in enumerate(chunks):
-            try:
-                content = f"Title: {article.get('title', '')}\nAuthor: {article.get('author', '')}\nDate: {article.get('publication_date', '')}\nChunk {idx+1}/{len(chunks)}\n\n{chunk}"
-                embedding = embedding_model.embed_query(content)
-                doc_id = f"{article.get('source_url', '')}#chunk-{idx+1}"
-                metadata = {
-                    "title": article.get("title", ""),
-                    "author": article.get("author", ""),
-                    "publication_date": article.get("publication_date", ""),
-                    "url": article.get("source_url", ""),
-                    "chunk_index": idx + 1,
-                    "chunk_text": chunk
-                }
-                vectors.append({"id": doc_id, "values": embedding, "metadata": metadata})
-            except Exception as e:
-                logger.error(f"[Pinecone] Embedding failed for article (Title: {article.get('title', '')}, Chunk {idx+1}): {e}")
-
-    try:
-        for i in tqdm(range(0, len(vectors), BATCH_SIZE), desc="Upserting to Pinecone"):
-            try:
-                batch = vectors[i:i + BATCH_SIZE]
-                index.upsert(vectors=batch)
-            except Exception as e:
-                logger.error(f"[Pinecone] Upsert failed for batch starting at index {i}: {e}")
-    except Exception as e:
-        logger.error(f"[Pinecone] Failed to upsert vectors: {e}")
-    logger.info(f"[Pinecone] Upserted {len(vectors)} vectors.")
-
+    stats = {**upserter.stats(), "skipped": skipped, "deleted": deleted}
+    logger.info(f"[Pinecone] {skipped} articles unchanged, {deleted} stale vectors deleted.")
+    return stats
 
 
+if __name__ == "__main__":
+    import argparse
 
+    parser = argparse.ArgumentParser(description="Upload today's articles to Neo4j and Pinecone.")
+    parser.add_argument("--backfill", action="store_true", help="Merge every stored article into Neo4j instead (no embedding)")
+    parser.add_argument("--force", action="store_true", help="Rewrite articles the sync manifest records as unchanged")
+    args = parser.parse_args()
 
-if __name__ == "__main__":
     try:
+        if args.backfill:
+            upload_to_neo4j(mark_duplicates(get_article_store().db.all_articles()), force=args.force)
+            sys.exit()
+        articles = filter_today_articles()
         if articles:
             logger.info(f"Processing {len(articles)} articles published today.")
-            upload_to_neo4j(articles)
-            embed_and_upsert(articles)
+            articles = mark_duplicates(articles)
+            upload_to_neo4j(articles, force=args.force)
+            embed_and_upsert(articles, force=args.force)
             logger.info("All tasks completed successfully.")
         else:
             logger.warning("No articles published today to process.")
@@ -0,0 +1,165 @@
+"""
+Batched, concurrent embedding for the uploader.
+
+Texts are embedded with `embed_documents` in batches of EMBED_BATCH_SIZE
+(Google's batchEmbedContents limit is 100), one request per batch. Up to
+EMBED_CONCURRENCY batches are in flight at once. Requests are paced by an
+adaptive limiter, the same AIMD DomainLimiter the scrapers use per site:
+quota errors (429 / RESOURCE_EXHAUSTED) halve the request rate and pause
+new batches, and successes raise it again. Each batch is retried on its
+own with full-jitter backoff, so a throttled batch never costs the others.
+
+Texts already in the embedding cache (llm/embedding_cache.py) are not sent
+at all, so re-runs and backfills cost next to no embedding calls.
+
+iter_embeddings() streams: it reads its texts lazily and yields vectors as
+batches complete, so the caller can upload them while later batches are
+still being embedded.
+"""
+
+import logging
+import os
+import re
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+
+from daily_news_pipeline.news_scrapers.rate_limiter import DomainLimiter, backoff_delay
+from llm.embedding_cache import QUERY_TASK_TYPE, get_embedding_cache
+
+
+# ------------------- CONFIGURATION -------------------
+
+EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "100"))     # Texts per embedding request
+EMBED_CONCURRENCY = int(os.getenv("EMBED_CONCURRENCY", "4"))     # Requests in flight
+EMBED_RATE = float(os.getenv("EMBED_RATE", "2"))                  # Requests/second to start at; adapts to quota
+EMBED_MAX_RETRIES = 4
+# embed_query used RETRIEVAL_QUERY for every stored vector; keep batches identical to it
+EMBED_TASK_TYPE = QUERY_TASK_TYPE
+
+QUOTA_ERROR = re.compile(r"\b429\b|resource.?exhausted|quota|rate.?limit", re.IGNORECASE)
+TRANSIENT_ERROR = re.compile(r"\b50[0234]\b|unavailable|deadline|timed?.?out|connection|internal", re.IGNORECASE)
+
+logger = logging.getLogger(__name__)
+
+
+def batches(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+# ------------------- EMBEDDING -------------------
+
+def _embed_batch(model, texts, limiter, max_retries):
+    """Embeds one batch under the limiter; returns its vectors, or None once retries are exhausted."""
+    for attempt in range(max_retries + 1):
+        delay = limiter.reserve()
+        if delay:
+            time.sleep(delay)
+        started = time.monotonic()
+        try:
+            vectors = model.embed_documents(texts, batch_size=len(texts), task_type=EMBED_TASK_TYPE)
+        except Exception as e:
+            message = str(e)
+            if QUOTA_ERROR.search(message):
+                limiter.record_throttle()
+            elif TRANSIENT_ERROR.search(message):
+                limiter.record_failure()
+            else:
+                logger.error(f"[Embeddings] Batch of {len(texts)} failed: {e}")
+                return None
+            if attempt == max_retries:
+                logger.error(f"[Embeddings] Batch of {len(texts)} failed after {max_retries + 1} attempts: {e}")
+                return None
+            pause = backoff_delay(attempt)
+            logger.warning(f"[Embeddings] Batch of {len(texts)} failed ({e}), retrying in {pause:.1f}s")
+            time.sleep(pause)
+            continue
+        limiter.record_success(time.monotonic() - started)
+        if len(vectors) != len(texts):
+            logger.error(f"[Embeddings] Batch of {len(texts)} returned {len(vectors)} vectors")
+            return None
+        return vectors
+    return None
+
+
+def iter_embeddings(model, texts, batch_size=EMBED_BATCH_SIZE, concurrency=EMBED_CONCURRENCY,
+                    limiter=None, max_retries=EMBED_MAX_RETRIES, cache=None):
+    """
+    Embeds `texts` with `model.embed_documents`, batched and concurrent, after
+    taking what it can from the embedding cache (`cache`, default the shared
+    one). Yields (position in `texts`, vector or None if its batch failed) as
+    results arrive, not in order.
+
+    `texts` may be any iterable; it is read one window at a time, and at most
+    2 x `concurrency` batches are outstanding. Memory stays bounded however
+    many texts there are, and the caller can consume vectors while later
+    batches are still being embedded.
+    """
+    texts = iter(texts)
+    cache = cache or get_embedding_cache()
+    model_name = getattr(model, "model", type(model).__name__)
+    limiter = limiter or DomainLimiter("embeddings", rate=EMBED_RATE, burst=concurrency)
+    window = batch_size * concurrency * 2
+    stats = {"cached": 0, "embedded": 0, "batches": 0, "failed": 0}
+    started = time.monotonic()
+
+    def finished(future):
+        batch, positions = outstanding.pop(future)
+        result = future.result()
+        if result is None:
+            stats["failed"] += 1
+            return [(position, None) for text in batch for position in positions[text]]
+        if cache:
+            cache.put_many(model_name, batch, result, EMBED_TASK_TYPE)
+        return [(position, vector) for text, vector in zip(batch, result) for position in positions[text]]
+
+    outstanding = {}  # future -> (texts in the batch, {text: positions})
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="embed") as pool:
+        offset = 0
+        while True:
+            part = list(islice(texts, window))
+            if not part:
+                break
+            vectors = cache.get_many(model_name, part, EMBED_TASK_TYPE) if cache else [None] * len(part)
+            positions = defaultdict(list)  # Each distinct uncached text is embedded once
+            for i, (text, vector) in enumerate(zip(part, vectors)):
+                if vector is None:
+                    positions[text].append(offset + i)
+                else:
+                    stats["cached"] += 1
+                    yield offset + i, vector
+
+            for batch in batches(list(positions), batch_size):
+                while len(outstanding) >= 2 * concurrency:
+                    done, _ = wait(outstanding, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from finished(future)
+                future = pool.submit(_embed_batch, model, batch, limiter, max_retries)
+                outstanding[future] = (batch, positions)
+                stats["batches"] += 1
+                stats["embedded"] += len(batch)
+            offset += len(part)
+
+        while outstanding:
+            done, _ = wait(outstanding, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from finished(future)
+
+    logger.info(
+        f"[Embeddings] {offset} texts: {stats['cached']} cached, {stats['embedded']} embedded in "
+        f"{stats['batches']} batches in {time.monotonic() - started:.1f}s "
+        f"({stats['failed']} batches failed, final rate {limiter.rate:.2f} req/s)"
+    )
+
+
+def embed_texts(model, texts, **options):
+    """
+    Like iter_embeddings(), but returns a list aligned with `texts`: one vector
+    per text, or None for texts whose batch failed.
+    """
+    texts = list(texts)
+    vectors = [None] * len(texts)
+    for position, vector in iter_embeddings(model, texts, **options):
+        vectors[position] = vector
+    return vectors
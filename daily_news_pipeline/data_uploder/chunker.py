@@ -0,0 +1,135 @@
+"""
+Sentence-aware chunking of article bodies for embedding.
+
+Bodies are split into sentences, at paragraph breaks and after sentence
+punctuation (common abbreviations excepted). Sentences are then packed into
+chunks of at most CHUNK_TOKENS, header included. Each chunk starts with the
+last CHUNK_OVERLAP_TOKENS worth of sentences of the previous one, so a
+fact spanning a boundary is whole in at least one chunk. A sentence longer
+than the budget is cut at word boundaries; a single word longer than the
+budget (a long URL, say) is cut by characters. A trailing piece under
+MIN_CHUNK_TOKENS is not embedded on its own; it is appended to the
+previous chunk.
+
+Tokens are estimated at CHARS_PER_TOKEN characters each. That is close
+enough for budgeting, and it needs no tokenizer for the embedding model.
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from typing import List
+
+
+# ------------------- CONFIGURATION -------------------
+
+CHUNK_TOKENS = int(os.getenv("CHUNK_TOKENS", "320"))                  # Budget per chunk, header included
+CHUNK_OVERLAP_TOKENS = int(os.getenv("CHUNK_OVERLAP_TOKENS", "32"))   # Sentences carried into the next chunk
+MIN_CHUNK_TOKENS = 32     # A trailing piece smaller than this joins the previous chunk
+CHARS_PER_TOKEN = 4
+
+ABBREVIATIONS = {
+    "mr", "mrs", "ms", "dr", "st", "jr", "sr", "vs", "feat", "ft", "prod", "vol", "no", "inc", "co", "lt", "gen",
+    "jan", "feb", "mar", "apr", "aug", "sep", "sept", "oct", "nov", "dec",
+}
+# Sentence punctuation, closing quotes/brackets (group 1), then whitespace before a capital or digit
+SENTENCE_END = re.compile(r"""(?<=[.!?…])(["'”’)\]]*)\s+(?=["'“‘(\[]?[A-Z0-9])""")
+
+
+def estimate_tokens(text):
+    return max(1, round(len(text) / CHARS_PER_TOKEN)) if text else 0
+
+
+@dataclass
+class Chunk:
+    index: int      # 1-based position in the article
+    text: str       # The chunk body (stored as metadata)
+    content: str    # Header + body, the text that is embedded
+
+
+# ------------------- SENTENCES -------------------
+
+def _is_abbreviation(fragment):
+    words = fragment.rstrip(".\"'”’)]").rsplit(None, 1)
+    last = words[-1].lower() if words else ""
+    return last in ABBREVIATIONS or re.fullmatch(r"(?:[a-z]\.)*[a-z]", last) is not None  # "U.S", "J"
+
+
+def split_sentences(text):
+    """Sentences of a text, in order; paragraph breaks always end a sentence."""
+    sentences = []
+    for paragraph in re.split(r"\s*\n\s*", text or ""):
+        pending = ""
+        start = 0
+        for match in SENTENCE_END.finditer(paragraph):
+            piece = paragraph[start:match.end(1)]
+            start = match.end()
+            if _is_abbreviation(piece):
+                pending += piece + " "
+                continue
+            sentences.append((pending + piece).strip())
+            pending = ""
+        tail = (pending + paragraph[start:]).strip()
+        if tail:
+            sentences.append(tail)
+    return [sentence for sentence in sentences if sentence]
+
+
+def _split_long(sentence, max_tokens):
+    """Cuts a sentence longer than the budget at word boundaries; a word over the budget is cut by characters."""
+    limit = max_tokens * CHARS_PER_TOKEN
+    words = [word[i:i + limit] for word in sentence.split() for i in range(0, len(word), limit)]
+    pieces, current = [], []
+    for word in words:
+        if current and estimate_tokens(" ".join(current + [word])) > max_tokens:
+            pieces.append(" ".join(current))
+            current = []
+        current.append(word)
+    if current:
+        pieces.append(" ".join(current))
+    return pieces
+
+
+# ------------------- PACKING -------------------
+
+def chunk_text(text, max_tokens=CHUNK_TOKENS, overlap_tokens=CHUNK_OVERLAP_TOKENS, min_tokens=MIN_CHUNK_TOKENS):
+    """Packs the text's sentences into chunks of at most `max_tokens`, overlapping by up to `overlap_tokens`."""
+    max_tokens = max(1, max_tokens)
+    sentences = []
+    for sentence in split_sentences(text):
+        sentences.extend(_split_long(sentence, max_tokens) if estimate_tokens(sentence) > max_tokens else [sentence])
+
+    chunks = []         # (sentences, number of them carried over from the previous chunk)
+    current, carried = [], 0
+    for sentence in sentences:
+        if len(current) > carried and estimate_tokens(" ".join(current + [sentence])) > max_tokens:
+            chunks.append((current, carried))
+            # Carry trailing sentences within the overlap budget, leaving room for the new one
+            overlap = []
+            for previous in reversed(current):
+                candidate = [previous] + overlap
+                if estimate_tokens(" ".join(candidate)) > overlap_tokens \
+                        or estimate_tokens(" ".join(candidate + [sentence])) > max_tokens:
+                    break
+                overlap = candidate
+            current, carried = overlap, len(overlap)
+        current.append(sentence)
+    if len(current) > carried:
+        fresh = current[carried:]
+        if chunks and estimate_tokens(" ".join(fresh)) < min_tokens:
+            chunks[-1] = (chunks[-1][0] + fresh, chunks[-1][1])
+        else:
+            chunks.append((current, carried))
+    return [" ".join(members) for members, _ in chunks]
+
+
+def article_header(article):
+    return f"Title: {article.get('title', '')}\nAuthor: {article.get('author', '')}\nDate: {article.get('publication_date', '')}"
+
+
+def chunk_article(article, max_tokens=CHUNK_TOKENS, overlap_tokens=CHUNK_OVERLAP_TOKENS) -> List[Chunk]:
+    """Chunks an article's description; each chunk's content is the header followed by the chunk."""
+    header = article_header(article)
+    body_budget = max(MIN_CHUNK_TOKENS, max_tokens - estimate_tokens(header))
+    texts = chunk_text((article.get("description") or "").strip(), body_budget, min(overlap_tokens, body_budget // 2))
+    return [Chunk(index, text, f"{header}\n\n{text}") for index, text in enumerate(texts, start=1)]
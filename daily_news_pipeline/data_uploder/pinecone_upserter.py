@@ -0,0 +1,152 @@
+"""
+Streaming, size-aware upserts to Pinecone.
+
+Vectors are added one at a time as their embeddings arrive. They are packed
+into requests by estimated JSON payload size, up to PINECONE_UPSERT_MB (Pinecone
+rejects requests over 2 MB), and by count, up to MAX_VECTORS_PER_REQUEST.
+A full batch is sent right away on a worker thread, with up to
+PINECONE_UPSERT_CONCURRENCY requests in flight. When every slot is busy,
+add() blocks, so memory stays at a few batches however long the stream is.
+Each request is retried on its own with full-jitter backoff.
+
+delete_vectors() removes vectors by id, such as chunks an article no longer
+produces.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from daily_news_pipeline.news_scrapers.rate_limiter import backoff_delay
+
+
+# ------------------- CONFIGURATION -------------------
+
+PINECONE_UPSERT_MB = float(os.getenv("PINECONE_UPSERT_MB", "1.5"))                 # Payload per request; the hard limit is 2 MB
+PINECONE_UPSERT_CONCURRENCY = int(os.getenv("PINECONE_UPSERT_CONCURRENCY", "4"))   # Requests in flight
+MAX_VECTORS_PER_REQUEST = 1000   # Pinecone's limit per upsert
+MAX_IDS_PER_DELETE = 1000        # Pinecone's limit per delete
+MAX_METADATA_BYTES = 40 * 1024   # Pinecone's limit per vector
+TRIMMED_FIELD = "chunk_text"     # Metadata field shortened when a vector is over the limit
+UPSERT_MAX_RETRIES = 3
+
+logger = logging.getLogger(__name__)
+
+
+def payload_bytes(value):
+    """Size of a value once serialized into the request body."""
+    return len(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+
+
+def fit_metadata(metadata, limit=MAX_METADATA_BYTES):
+    """Returns metadata within `limit` bytes, shortening TRIMMED_FIELD if it has to."""
+    excess = payload_bytes(metadata) - limit
+    text = metadata.get(TRIMMED_FIELD)
+    if excess <= 0 or not isinstance(text, str):
+        return metadata
+    encoded = text.encode("utf-8")
+    # JSON escaping can cost more than one byte per character; leave some slack
+    trimmed = encoded[:max(0, len(encoded) - excess - 64)].decode("utf-8", errors="ignore")
+    return {**metadata, TRIMMED_FIELD: trimmed}
+
+
+# ------------------- UPSERTER -------------------
+
+class PineconeUpserter:
+    """
+    Buffers vectors ({"id", "values", "metadata"}) into size-bounded upsert
+    requests and sends them concurrently. Call close() (or use it as a
+    context manager) to send the last batch and wait for the requests.
+    """
+
+    def __init__(self, index, max_bytes=None, max_vectors=MAX_VECTORS_PER_REQUEST,
+                 concurrency=PINECONE_UPSERT_CONCURRENCY, max_retries=UPSERT_MAX_RETRIES):
+        self.index = index
+        self.max_bytes = max_bytes or int(PINECONE_UPSERT_MB * 1024 * 1024)
+        self.max_vectors = max_vectors
+        self.max_retries = max_retries
+        self.failed_ids = []
+        self._pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="upsert")
+        self._slots = threading.BoundedSemaphore(concurrency)
+        self._lock = threading.Lock()
+        self._batch, self._batch_bytes = [], 0
+        self._stats = {"upserted": 0, "failed": 0, "requests": 0}
+        self._started = time.monotonic()
+
+    def add(self, vector):
+        """Queues one vector; sends the current batch first if the vector would not fit in it."""
+        if vector.get("metadata"):
+            vector = {**vector, "metadata": fit_metadata(vector["metadata"])}
+        size = payload_bytes(vector) + 2
+        if self._batch and (self._batch_bytes + size > self.max_bytes or len(self._batch) >= self.max_vectors):
+            self.flush()
+        self._batch.append(vector)
+        self._batch_bytes += size
+
+    def flush(self):
+        """Sends the buffered vectors; blocks while every request slot is busy."""
+        if not self._batch:
+            return
+        batch, self._batch, self._batch_bytes = self._batch, [], 0
+        self._slots.acquire()
+        future = self._pool.submit(self._send, batch)
+        future.add_done_callback(lambda _: self._slots.release())
+
+    def _send(self, batch):
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.index.upsert(vectors=batch)
+            except Exception as e:
+                if attempt == self.max_retries:
+                    logger.error(f"[Pinecone] Upsert of {len(batch)} vectors failed after {attempt + 1} attempts: {e}")
+                    with self._lock:
+                        self._stats["failed"] += len(batch)
+                        self._stats["requests"] += attempt + 1
+                        self.failed_ids.extend(vector["id"] for vector in batch)
+                    return
+                pause = backoff_delay(attempt)
+                logger.warning(f"[Pinecone] Upsert of {len(batch)} vectors failed ({e}), retrying in {pause:.1f}s")
+                time.sleep(pause)
+                continue
+            with self._lock:
+                self._stats["upserted"] += len(batch)
+                self._stats["requests"] += attempt + 1
+            return
+
+    def close(self):
+        """Sends what is left, waits for every request, and returns {"upserted", "failed", "requests"}."""
+        self.flush()
+        self._pool.shutdown(wait=True)
+        stats = self.stats()
+        logger.info(
+            f"[Pinecone] Upserted {stats['upserted']} vectors in {stats['requests']} requests "
+            f"in {time.monotonic() - self._started:.1f}s, {stats['failed']} failed."
+        )
+        return stats
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ------------------- DELETES -------------------
+
+def delete_vectors(index, ids):
+    """Deletes vectors by id, in requests of at most MAX_IDS_PER_DELETE. Returns False if any request failed."""
+    ids = sorted(ids)
+    for i in range(0, len(ids), MAX_IDS_PER_DELETE):
+        try:
+            index.delete(ids=ids[i:i + MAX_IDS_PER_DELETE])
+        except Exception as e:
+            logger.error(f"[Pinecone] Failed to delete {len(ids[i:i + MAX_IDS_PER_DELETE])} vectors: {e}")
+            return False
+    return True
@@ -0,0 +1,125 @@
+"""
+Record of what has been loaded into Neo4j and Pinecone.
+
+For every article (by canonical URL) the manifest keeps a hash of the row
+last merged into Neo4j, a hash of the chunk vectors last upserted to
+Pinecone, and the ids of those vectors. The uploader hashes each article
+again on every run and writes only the ones whose hash changed, so a
+steady-state run makes next to no external writes. When an article is
+re-chunked into fewer pieces, the ids it no longer produces are deleted
+from Pinecone instead of being left behind as orphans.
+
+A hash of None means the last write was incomplete, and the article is
+written again on the next run. If a store is wiped or rebuilt, run the
+uploader with --force to rewrite everything.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+
+from daily_news_pipeline.news_scrapers.article_store import DATA_DIR
+from utils.sqlite_store import SQLiteStore
+
+
+# ------------------- CONFIGURATION -------------------
+
+MANIFEST_FILE = DATA_DIR / "sync_manifest.db"
+ENABLED = os.getenv("SYNC_MANIFEST", "1") != "0"
+LOOKUP_CHUNK = 500      # URLs per SELECT ... IN (...)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS synced_articles (
+    source_url TEXT PRIMARY KEY,
+    neo4j_hash TEXT,
+    neo4j_synced_at TEXT,
+    vector_hash TEXT,
+    vector_ids TEXT,
+    vectors_synced_at TEXT
+);
+"""
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(value):
+    """Stable hash of a JSON-serializable value."""
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+# ------------------- MANIFEST -------------------
+
+class SyncManifest(SQLiteStore):
+    """SQLite table of per-article sync state, keyed by canonical source URL."""
+
+    SCHEMA = SCHEMA
+
+    def __init__(self, path=MANIFEST_FILE):
+        super().__init__(path)
+
+    def neo4j_hashes(self, urls):
+        """{url: hash of the row last merged into Neo4j} for the given URLs that have one."""
+        urls = list(set(urls))
+        conn = self._connection()
+        hashes = {}
+        for i in range(0, len(urls), LOOKUP_CHUNK):
+            chunk = urls[i:i + LOOKUP_CHUNK]
+            hashes.update(conn.execute(
+                f"SELECT source_url, neo4j_hash FROM synced_articles "
+                f"WHERE neo4j_hash IS NOT NULL AND source_url IN ({', '.join('?' * len(chunk))})", chunk
+            ).fetchall())
+        return hashes
+
+    def mark_neo4j(self, hashes):
+        """Records rows merged into Neo4j; `hashes` is [(url, row hash)]."""
+        now = _now()
+        with self._connection() as conn:
+            conn.executemany(
+                "INSERT INTO synced_articles (source_url, neo4j_hash, neo4j_synced_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(source_url) DO UPDATE SET neo4j_hash = excluded.neo4j_hash, neo4j_synced_at = excluded.neo4j_synced_at",
+                [(url, digest, now) for url, digest in hashes],
+            )
+
+    def vector_state(self, url):
+        """(vector hash, set of vector ids) last written for an article, or None if it never was."""
+        row = self._connection().execute(
+            "SELECT vector_hash, vector_ids FROM synced_articles WHERE source_url = ?", (url,)
+        ).fetchone()
+        if row is None or row[1] is None:
+            return None
+        return row[0], set(json.loads(row[1]))
+
+    def mark_vectors(self, url, digest, ids):
+        """Records the vector ids an article has in Pinecone; a None digest forces a rewrite next run."""
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT INTO synced_articles (source_url, vector_hash, vector_ids, vectors_synced_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(source_url) DO UPDATE SET vector_hash = excluded.vector_hash, "
+                "vector_ids = excluded.vector_ids, vectors_synced_at = excluded.vectors_synced_at",
+                (url, digest, json.dumps(sorted(ids)), _now()),
+            )
+
+    def size(self):
+        return self._connection().execute("SELECT COUNT(*) FROM synced_articles").fetchone()[0]
+
+
+_manifest = None
+_manifest_lock = threading.Lock()
+
+
+def get_sync_manifest():
+    """Returns the process-wide sync manifest, or None when disabled with SYNC_MANIFEST=0."""
+    global _manifest
+    if not ENABLED:
+        return None
+    with _manifest_lock:
+        if _manifest is None:
+            _manifest = SyncManifest()
+        return _manifest
@@ -0,0 +1,318 @@
+import atexit
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+from .canonical_urls import canonical_url
+
+
+# ------------------- CONFIGURATION -------------------
+
+DATA_DIR = Path(__file__).resolve().parent / "news_articles_data"
+DB_FILE = DATA_DIR / "news_articles.db"
+LEGACY_JSON_FILE = DATA_DIR / "news_articles_scrap_data.json"  # Imported once into an empty database
+BATCH_SIZE = 50        # Articles written per commit at most
+FLUSH_INTERVAL = 1.0   # Seconds the writer waits to fill a batch
+DATE_FORMAT = "%d-%m-%Y"  # publication_date format produced by the scrapers
+SCHEMA_VERSION = 1  # 1: URLs in canonical form (canonical_urls.py)
+
+ARTICLE_FIELDS = ("source_url", "title", "description", "author", "publication_date")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    source_url TEXT NOT NULL,
+    title TEXT,
+    description TEXT,
+    author TEXT,
+    publication_date TEXT,
+    published_on TEXT,
+    scraped_at TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_articles_source_url ON articles (source_url);
+CREATE INDEX IF NOT EXISTS idx_articles_published_on ON articles (published_on);
+CREATE TABLE IF NOT EXISTS seen_urls (
+    url TEXT PRIMARY KEY,
+    seen_at TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+logger = logging.getLogger(__name__)
+
+
+def to_iso_date(publication_date):
+    """Converts a scraped DD-MM-YYYY date to ISO YYYY-MM-DD, or None when unknown."""
+    try:
+        return datetime.strptime((publication_date or "").strip(), DATE_FORMAT).date().isoformat()
+    except ValueError:
+        return None
+
+
+# ------------------- SQLITE DATABASE -------------------
+
+class ArticleDatabase:
+    """
+    Embedded SQLite article database in WAL mode.
+
+    `source_url` has a unique index, so dedup is an index lookup, and
+    `published_on` (ISO date) is indexed for date-range queries. Every thread
+    gets its own connection; WAL lets readers run while the writer commits.
+    """
+
+    def __init__(self, path=DB_FILE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+        if self._connection().execute("PRAGMA user_version").fetchone()[0] < 1:
+            self.canonicalize_urls()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def count(self):
+        return self._connection().execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def exists(self, url):
+        row = self._connection().execute("SELECT 1 FROM articles WHERE source_url = ?", (url,)).fetchone()
+        return row is not None
+
+    def is_seen(self, url):
+        """True if the URL is a stored article or was recorded as fetched without one."""
+        row = self._connection().execute(
+            "SELECT 1 FROM articles WHERE source_url = ? UNION ALL SELECT 1 FROM seen_urls WHERE url = ? LIMIT 1",
+            (url, url),
+        ).fetchone()
+        return row is not None
+
+    def seen_urls(self):
+        """Iterates over every known URL: article sources and recorded seen URLs."""
+        cursor = self._connection().execute("SELECT source_url FROM articles UNION ALL SELECT url FROM seen_urls")
+        for (url,) in cursor:
+            yield url
+
+    def mark_seen(self, urls):
+        seen_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        with self._connection() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO seen_urls (url, seen_at) VALUES (?, ?)",
+                [(canonical_url(url), seen_at) for url in urls],
+            )
+
+    def insert_batch(self, articles):
+        """Inserts articles in one transaction, skipping known URLs; returns rows inserted."""
+        scraped_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        rows = [
+            (
+                canonical_url(article["source_url"]),
+                article.get("title"),
+                article.get("description"),
+                article.get("author"),
+                article.get("publication_date"),
+                to_iso_date(article.get("publication_date")),
+                scraped_at,
+            )
+            for article in articles
+            if article.get("source_url")
+        ]
+        with self._connection() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                """INSERT OR IGNORE INTO articles
+                   (source_url, title, description, author, publication_date, published_on, scraped_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                rows,
+            )
+            return conn.total_changes - before
+
+    def articles_published_between(self, start, end):
+        """Returns articles whose publication date falls in [start, end] (dates or ISO strings)."""
+        start = start.isoformat() if isinstance(start, date) else start
+        end = end.isoformat() if isinstance(end, date) else end
+        rows = self._connection().execute(
+            f"SELECT {', '.join(ARTICLE_FIELDS)} FROM articles WHERE published_on BETWEEN ? AND ? ORDER BY id",
+            (start, end),
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def all_articles(self):
+        """Returns every stored article in insertion order."""
+        rows = self._connection().execute(f"SELECT {', '.join(ARTICLE_FIELDS)} FROM articles ORDER BY id").fetchall()
+        return [dict(row) for row in rows]
+
+    def canonicalize_urls(self):
+        """
+        Migrates stored URLs to canonical form (schema version 1).
+
+        Articles stored under several variants of one URL collapse into the
+        copy with the longest body (the earliest on ties). Returns
+        (rewritten, removed) article counts.
+        """
+        conn = self._connection()
+        groups = defaultdict(list)
+        for row in conn.execute("SELECT id, source_url, length(coalesce(description, '')) AS size FROM articles ORDER BY id"):
+            groups[canonical_url(row["source_url"])].append(row)
+        rewrites, removed = [], []
+        for url, rows in groups.items():
+            keep = max(rows, key=lambda row: (row["size"], -row["id"]))
+            removed.extend((row["id"],) for row in rows if row is not keep)
+            if keep["source_url"] != url:
+                rewrites.append((url, keep["id"]))
+        seen = [row["url"] for row in conn.execute("SELECT url FROM seen_urls")]
+        renamed = [(canonical_url(url), url) for url in seen if canonical_url(url) != url]
+
+        with conn:
+            # Deletes first, so no rewrite collides with a variant about to go
+            conn.executemany("DELETE FROM articles WHERE id = ?", removed)
+            conn.executemany("UPDATE articles SET source_url = ? WHERE id = ?", rewrites)
+            conn.executemany("INSERT OR IGNORE INTO seen_urls (url, seen_at) SELECT ?, seen_at FROM seen_urls WHERE url = ?", renamed)
+            conn.executemany("DELETE FROM seen_urls WHERE url = ?", [(url,) for _, url in renamed])
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        if rewrites or removed or renamed:
+            logger.info(
+                f"Canonicalized URLs in {self.path}: {len(rewrites)} articles rewritten, "
+                f"{len(removed)} duplicates removed, {len(renamed)} seen URLs rewritten"
+            )
+        return len(rewrites), len(removed)
+
+    def import_json(self, path):
+        """Loads a scrape file in the old JSON array format; returns rows inserted."""
+        with open(path, "r", encoding="utf-8") as f:
+            articles = [a for a in json.load(f) if isinstance(a, dict)]
+        return self.insert_batch(articles)
+
+
+# ------------------- SINGLE WRITER -------------------
+
+class ArticleStore:
+    """
+    Shared article store for all scrapers.
+
+    Scrapers call `submit()` from any thread. Source URLs are put in
+    canonical form, and articles whose URL is already stored or queued are
+    dropped; the rest go through a queue to one writer thread, which commits
+    them to the database in batches. Seen URLs recorded with `mark_seen()`
+    go through the same writer.
+    """
+
+    def __init__(self, path=DB_FILE, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL, legacy_json=LEGACY_JSON_FILE):
+        self.db = ArticleDatabase(path)
+        if self.db.count() == 0 and legacy_json and Path(legacy_json).exists():
+            imported = self.db.import_json(legacy_json)
+            logger.info(f"Imported {imported} articles from {legacy_json}")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="article-store-writer", daemon=True)
+        self._writer.start()
+        logger.info(f"Article store opened with {self.db.count()} articles: {self.db.path}")
+
+    def exists(self, url):
+        """True if the URL is stored or waiting to be written."""
+        with self._lock:
+            if url in self._pending:
+                return True
+        return self.db.exists(url)
+
+    def submit(self, articles):
+        """Queues new articles for writing; returns how many were accepted."""
+        accepted = 0
+        for article in articles:
+            if not article.get("source_url"):
+                continue
+            url = canonical_url(article["source_url"])
+            if self.db.exists(url):
+                continue
+            article = {**article, "source_url": url}
+            with self._lock:
+                if url in self._pending:
+                    continue
+                self._pending.add(url)
+            self._queue.put(article)
+            accepted += 1
+        logger.info(f"Queued {accepted} new articles ({len(articles) - accepted} duplicates dropped)")
+        return accepted
+
+    def mark_seen(self, urls):
+        """Queues URLs that were fetched but produced no article, so later runs skip them."""
+        for url in urls:
+            self._queue.put(canonical_url(url))
+
+    def flush(self):
+        """Blocks until every queued article has been committed."""
+        self._queue.join()
+
+    def articles_published_between(self, start, end):
+        return self.db.articles_published_between(start, end)
+
+    def articles_published_on(self, day):
+        return self.db.articles_published_between(day, day)
+
+    def _next_batch(self):
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _write_loop(self):
+        while True:
+            batch = self._next_batch()
+            articles = [item for item in batch if isinstance(item, dict)]
+            seen = [item for item in batch if isinstance(item, str)]
+            try:
+                if articles:
+                    inserted = self.db.insert_batch(articles)
+                    logger.info(f"Committed {inserted} articles to {self.db.path}")
+                if seen:
+                    self.db.mark_seen(seen)
+            except Exception as e:
+                logger.error(f"Failed to commit {len(batch)} items to {self.db.path}: {e}")
+            finally:
+                with self._lock:
+                    self._pending.difference_update(article["source_url"] for article in articles)
+                for _ in batch:
+                    self._queue.task_done()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_article_store():
+    """Returns the process-wide article store, opening it on first use."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ArticleStore()
+            atexit.register(_store.flush)
+        return _store
+
+
+def set_article_store(store):
+    """Makes `store` the process-wide article store; call before any scraper runs (e.g. benchmarks)."""
+    global _store
+    with _store_lock:
+        _store = store
@@ -0,0 +1,227 @@
+import asyncio
+import atexit
+import logging
+import math
+import sys
+import threading
+from concurrent.futures import CancelledError, TimeoutError
+from urllib.parse import urlsplit
+
+from playwright.async_api import async_playwright
+
+from .replay import get_recorder, get_replay
+
+if sys.platform == "win32":
+    asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+
+
+# ------------------- CONFIGURATION -------------------
+
+MAX_PAGES = 4       # Pages rendered at the same time across all scrapers
+TIMEOUT = 60        # Seconds allowed for one navigation
+CLOSE_TIMEOUT = 30  # Seconds allowed for closing the browser
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36"
+VIEWPORT = {"width": 1280, "height": 800}
+LAUNCH_ARGS = ["--disable-blink-features=AutomationControlled"]
+
+# Requests aborted before they leave the browser
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+TRACKER_DOMAINS = (
+    "google-analytics.com", "googletagmanager.com", "googlesyndication.com", "googleadservices.com",
+    "doubleclick.net", "adservice.google.com", "amazon-adsystem.com", "facebook.net", "connect.facebook.net",
+    "scorecardresearch.com", "quantserve.com", "quantcount.com", "chartbeat.com", "chartbeat.net",
+    "hotjar.com", "criteo.com", "criteo.net", "taboola.com", "outbrain.com", "adnxs.com",
+    "pubmatic.com", "rubiconproject.com", "moatads.com", "adsafeprotected.com", "permutive.com",
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPoolClosed(RuntimeError):
+    """Raised when work is handed to a browser pool that has been shut down."""
+
+
+def is_tracker(url):
+    host = urlsplit(url).hostname or ""
+    return any(host == domain or host.endswith("." + domain) for domain in TRACKER_DOMAINS)
+
+
+# ------------------- POOL -------------------
+
+class BrowserPool:
+    """
+    One headless Chromium shared by the Playwright scrapers for a whole run.
+
+    The browser lives on a private event loop in a background thread, so the
+    synchronous scrapers (themselves running in worker threads) hand it
+    coroutines through `render_pages()`. All pages share one context, at most
+    `max_pages` are open at once, and images, media, fonts and known trackers
+    are aborted by route interception.
+
+    Once `shutdown()` runs, the pool refuses new work and calls still waiting
+    on it fail, so a scraper thread abandoned after a timeout cannot block on
+    the stopped loop.
+    """
+
+    def __init__(self, max_pages=MAX_PAGES, user_agent=USER_AGENT, viewport=VIEWPORT):
+        self.max_pages = max_pages
+        self.user_agent = user_agent
+        self.viewport = viewport
+        self.blocked = 0
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._closed = False
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="browser-pool", daemon=True)
+        self._thread.start()
+        self._start_lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(max_pages)
+
+    def _call(self, coro, timeout):
+        """Runs a coroutine on the pool's loop and waits up to `timeout` seconds for its result."""
+        with self._pending_lock:
+            if self._closed:
+                coro.close()
+                raise BrowserPoolClosed("Browser pool has been shut down")
+            future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+            self._pending.add(future)
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Browser pool call timed out after {timeout:.0f}s")
+        except CancelledError:
+            raise BrowserPoolClosed("Browser pool was shut down during the call")
+        finally:
+            with self._pending_lock:
+                self._pending.discard(future)
+
+    async def _ensure_browser(self):
+        async with self._start_lock:
+            if self._context is not None:
+                return
+            logger.info("Launching shared browser...")
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=True, args=LAUNCH_ARGS)
+            self._context = await self._browser.new_context(user_agent=self.user_agent, viewport=self.viewport)
+            await self._context.route("**/*", self._route)
+
+    async def _route(self, route):
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or is_tracker(request.url):
+            self.blocked += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def render(self, url, wait_for=None, scroll=0, settle_ms=0, timeout=TIMEOUT):
+        """Loads a URL in a fresh page and returns its rendered HTML."""
+        async with self._slots:
+            await self._ensure_browser()
+            page = await self._context.new_page()
+            try:
+                await page.goto(url, wait_until="domcontentloaded", timeout=timeout * 1000)
+                if scroll:
+                    await page.mouse.wheel(0, scroll)
+                if wait_for:
+                    await page.wait_for_selector(wait_for, timeout=timeout * 1000)
+                if settle_ms:
+                    await page.wait_for_timeout(settle_ms)
+                return await page.content()
+            finally:
+                await page.close()
+
+    async def _render_or_none(self, url, **options):
+        archive = get_replay()
+        if archive is not None:
+            return archive.render(url)
+        try:
+            html = await self.render(url, **options)
+            logger.info(f"Rendered {url}")
+        except Exception as e:
+            logger.error(f"Failed to render {url}: {e}")
+            html = None
+        recorder = get_recorder()
+        if recorder is not None:
+            recorder.write_render(url, html)
+        return html
+
+    def render_pages(self, urls, **options):
+        """Renders URLs concurrently; returns {url: html or None on failure}."""
+        urls = list(dict.fromkeys(urls))
+
+        async def _render_all():
+            return await asyncio.gather(*(self._render_or_none(url, **options) for url in urls))
+
+        if not urls:
+            return {}
+        # Every URL may wait for a slot, then navigate and wait for its selector
+        timeout = 2 * TIMEOUT * (math.ceil(len(urls) / self.max_pages) + 1)
+        return dict(zip(urls, self._call(_render_all(), timeout)))
+
+    async def _close(self):
+        if self._context is not None:
+            await self._context.close()
+            await self._browser.close()
+            await self._playwright.stop()
+            logger.info(f"Shared browser closed ({self.blocked} requests blocked)")
+        self._context = self._browser = self._playwright = None
+
+    def shutdown(self):
+        """Closes the browser and stops the pool's event loop; later calls raise BrowserPoolClosed."""
+        with self._pending_lock:
+            if self._closed:
+                return
+            self._closed = True
+            # Calls still in flight fail now instead of waiting on a loop that is about to stop
+            for future in self._pending:
+                future.cancel()
+        try:
+            asyncio.run_coroutine_threadsafe(self._close(), self._loop).result(timeout=CLOSE_TIMEOUT)
+        except Exception as e:
+            logger.error(f"Error closing shared browser: {e}")
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=10)
+
+
+_pool = None
+_pool_open = True   # False between shutdown_browser_pool() and the next open_browser_pool()
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool():
+    """Returns the process-wide browser pool, creating it on first use; raises BrowserPoolClosed after shutdown."""
+    global _pool
+    with _pool_lock:
+        if not _pool_open:
+            raise BrowserPoolClosed("Browser pool is shut down until the next run opens it")
+        if _pool is None:
+            _pool = BrowserPool()
+        return _pool
+
+
+def open_browser_pool():
+    """Lets get_browser_pool() start a browser again; called when a pipeline run starts."""
+    global _pool_open
+    with _pool_lock:
+        _pool_open = True
+
+
+def shutdown_browser_pool():
+    """
+    Closes the shared browser if one was started. Until open_browser_pool(),
+    get_browser_pool() refuses to start another, so scrapers abandoned by a
+    finished run cannot leave a browser behind.
+    """
+    global _pool, _pool_open
+    with _pool_lock:
+        pool, _pool, _pool_open = _pool, None, False
+    if pool is not None:
+        pool.shutdown()
+
+
+atexit.register(shutdown_browser_pool)
@@ -0,0 +1,63 @@
+"""
+Canonical form of article URLs.
+
+The same article can be linked as http or https, with or without a
+trailing slash, as an AMP page, or with campaign parameters attached.
+Scrapers, the article store and the uploader all key articles by
+`canonical_url()`, so those variants are fetched, stored, merged and
+embedded once.
+"""
+
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+# ------------------- CONFIGURATION -------------------
+
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "_ga", "_gl", "ref", "ref_src", "cmpid", "ito", "amp",
+}
+TRACKING_PREFIXES = ("utm_", "pk_", "hsa_")
+DEFAULT_PORTS = {"http": 80, "https": 443}
+AMP_SUFFIX = re.compile(r"/amp/?$", re.IGNORECASE)
+
+
+# ------------------- CANONICALIZATION -------------------
+
+def _is_tracking(name):
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonical_url(url):
+    """
+    Returns the canonical form of an http(s) URL:
+    https, lowercase host without default port, no AMP suffix or trailing
+    slash, tracking parameters and fragment removed, remaining query
+    parameters sorted. Other strings are returned stripped but unchanged.
+    """
+    url = (url or "").strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    if parts.scheme.lower() not in DEFAULT_PORTS or not parts.hostname:
+        return url
+
+    host = parts.hostname.lower()
+    if port and port != DEFAULT_PORTS[parts.scheme.lower()]:
+        host = f"{host}:{port}"
+    path = re.sub(r"/{2,}", "/", parts.path)
+    path = AMP_SUFFIX.sub("", path).rstrip("/") or "/"
+    query = sorted((name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True) if not _is_tracking(name))
+    return urlunsplit(("https", host, path, urlencode(query), ""))
+
+
+def same_site(a, b):
+    """True if two URLs are on the same host, ignoring "www."."""
+    def host(url):
+        hostname = urlsplit(url).hostname or ""
+        return hostname[4:] if hostname.startswith("www.") else hostname
+    return host(a) == host(b)
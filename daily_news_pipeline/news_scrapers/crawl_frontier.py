@@ -0,0 +1,61 @@
+import logging
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlFrontier:
+    """
+    FIFO queue of URLs waiting to be crawled.
+
+    Every URL is admitted at most once per crawl. URLs found on a page get
+    the page's depth + 1; anything deeper than `max_depth`, or past
+    `max_urls` admitted in total, is dropped.
+
+    With a `journal` (CrawlJournal), admissions and `done()` calls are
+    recorded, and the frontier starts from whatever an interrupted run left.
+    """
+
+    def __init__(self, max_depth=1, max_urls=None, journal=None):
+        self.max_depth = max_depth
+        self.max_urls = max_urls
+        self.journal = journal
+        self._queue = deque()
+        self._seen = set()
+        if journal is not None:
+            pending, done = journal.load()
+            self._seen.update(done)
+            for url, depth, data in pending:
+                self._seen.add(url)
+                self._queue.append((url, depth, data))
+
+    def add(self, url, depth=0, data=None):
+        """Admits a URL; returns False if it was already seen or is out of bounds."""
+        if url in self._seen or depth > self.max_depth:
+            return False
+        if self.max_urls is not None and len(self._seen) >= self.max_urls:
+            logger.debug(f"Frontier full ({self.max_urls} URLs), dropping {url}")
+            return False
+        self._seen.add(url)
+        self._queue.append((url, depth, data))
+        if self.journal is not None:
+            self.journal.record_queued(url, depth, data)
+        return True
+
+    def done(self, url):
+        """Records that a popped URL has been fully handled."""
+        if self.journal is not None:
+            self.journal.record_done(url)
+
+    def complete(self):
+        """Ends the crawl; a journal is discarded so the next run starts fresh."""
+        if self.journal is not None:
+            self.journal.complete()
+
+    def pop_batch(self, size=None):
+        """Removes and returns up to `size` queued (url, depth, data) entries (all if None)."""
+        size = len(self._queue) if size is None else min(size, len(self._queue))
+        return [self._queue.popleft() for _ in range(size)]
+
+    def __len__(self):
+        return len(self._queue)
@@ -0,0 +1,82 @@
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+
+
+# ------------------- CONFIGURATION -------------------
+
+JOURNAL_DIR = Path(__file__).resolve().parent / "news_articles_data" / "crawl_journal"
+MAX_AGE_HOURS = 72  # Journals older than this are discarded instead of resumed
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlJournal:
+    """
+    Append-only JSONL record of one scraper's crawl state.
+
+    Every URL admitted to the frontier and every URL finished is written (and
+    flushed) as it happens. If the run dies halfway, the next run of the same
+    scraper reloads the journal: finished URLs are skipped and queued ones are
+    crawled again. A run that completes deletes its journal.
+    """
+
+    def __init__(self, name, directory=None, max_age_hours=MAX_AGE_HOURS):
+        self.name = name
+        self.path = Path(directory or JOURNAL_DIR) / f"{name}.jsonl"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_age_hours = max_age_hours
+        self._lock = threading.Lock()
+        self._file = None
+
+    def load(self):
+        """Returns (pending [(url, depth, data)], done {url}) left by an interrupted run."""
+        if not self.path.exists():
+            return [], set()
+        age_hours = (time.time() - self.path.stat().st_mtime) / 3600
+        if age_hours > self.max_age_hours:
+            logger.info(f"[{self.name}] Discarding crawl journal from {age_hours:.0f}h ago")
+            self.path.unlink()
+            return [], set()
+
+        queued, done = {}, set()
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Torn last line from a crash
+                if entry.get("event") == "queued":
+                    queued.setdefault(entry["url"], (entry["url"], entry.get("depth", 0), entry.get("data")))
+                elif entry.get("event") == "done":
+                    done.add(entry["url"])
+
+        pending = [item for url, item in queued.items() if url not in done]
+        logger.info(f"[{self.name}] Resuming crawl: {len(done)} URLs done, {len(pending)} still queued")
+        return pending, done
+
+    def _write(self, entry):
+        with self._lock:
+            if self._file is None:
+                torn = self.path.exists() and self.path.stat().st_size and not self.path.read_bytes().endswith(b"\n")
+                self._file = open(self.path, "a", encoding="utf-8")
+                if torn:
+                    self._file.write("\n")  # Keep a crash's partial line from swallowing the next entry
+            self._file.write(json.dumps(entry) + "\n")
+            self._file.flush()
+
+    def record_queued(self, url, depth=0, data=None):
+        self._write({"event": "queued", "url": url, "depth": depth, "data": data})
+
+    def record_done(self, url):
+        self._write({"event": "done", "url": url})
+
+    def complete(self):
+        """Marks the crawl finished: the journal is removed."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self.path.unlink(missing_ok=True)
@@ -0,0 +1,125 @@
+import logging
+import os
+import xml.etree.ElementTree as ET
+from datetime import timedelta, timezone
+
+from dateutil import parser as date_parser
+
+from .fetch_engine import fetch_pages
+from .replay import reference_time
+
+
+# ------------------- CONFIGURATION -------------------
+
+DISCOVERY_MODE = os.getenv("SCRAPER_DISCOVERY", "feeds")  # "feeds" (fall back to homepage) or "homepage"
+MAX_AGE_HOURS = float(os.getenv("SCRAPER_DISCOVERY_MAX_AGE_HOURS", "48"))  # Older entries are ignored
+MAX_CHILD_SITEMAPS = 3  # Most recent sitemaps followed from a sitemap index
+
+logger = logging.getLogger(__name__)
+
+
+# ------------------- PARSING -------------------
+
+def _local(tag):
+    """Tag name without its XML namespace."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _child_text(element, *names):
+    for child in element.iter():
+        if _local(child.tag) in names and child.text and child.text.strip():
+            return child.text.strip()
+    return None
+
+
+def _parse_date(raw):
+    if not raw:
+        return None
+    try:
+        parsed = date_parser.parse(raw)
+    except (ValueError, OverflowError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def parse_feed(content):
+    """
+    Parses an RSS/Atom feed, sitemap or sitemap index.
+
+    Returns (entries, child_sitemaps): lists of (url, datetime or None).
+    """
+    root = ET.fromstring(content)
+    kind = _local(root.tag)
+    entries, children = [], []
+
+    if kind == "sitemapindex":
+        for sitemap in root:
+            children.append((_child_text(sitemap, "loc"), _parse_date(_child_text(sitemap, "lastmod"))))
+    elif kind == "urlset":
+        for url in root:
+            published = _child_text(url, "publication_date") or _child_text(url, "lastmod")
+            entries.append((_child_text(url, "loc"), _parse_date(published)))
+    elif kind in ("rss", "RDF"):
+        for item in root.iter():
+            if _local(item.tag) == "item":
+                entries.append((_child_text(item, "link"), _parse_date(_child_text(item, "pubDate", "date"))))
+    elif kind == "feed":  # Atom
+        for entry in root:
+            if _local(entry.tag) != "entry":
+                continue
+            link = next((l.get("href") for l in entry if _local(l.tag) == "link" and l.get("rel", "alternate") == "alternate"), None)
+            entries.append((link, _parse_date(_child_text(entry, "published", "updated"))))
+    else:
+        raise ValueError(f"Unrecognised feed root <{kind}>")
+
+    return [e for e in entries if e[0]], [c for c in children if c[0]]
+
+
+# ------------------- DISCOVERY -------------------
+
+def _read_feeds(urls, since):
+    """Fetches feeds concurrently; returns (entries, child sitemaps worth following, bytes read)."""
+    entries, children, size = [], [], 0
+    for url, page in fetch_pages(urls).items():
+        if not page.ok:
+            continue
+        size += len(page.content)
+        try:
+            found, nested = parse_feed(page.content)
+        except (ET.ParseError, ValueError) as e:
+            logger.warning(f"Could not parse feed {url}: {e}")
+            continue
+        entries.extend(found)
+        children.extend(child for child in nested if child[1] is None or child[1] >= since)
+    return entries, children, size
+
+
+def discover_urls(source, feeds, max_age_hours=MAX_AGE_HOURS, url_filter=None):
+    """
+    Lists recent article URLs of a source from its RSS/Atom feeds and
+    (news) sitemaps, newest first. Entries whose date is older than `max_age_hours` are
+    dropped; undated entries are kept.
+
+    Returns None when discovery is disabled or no feed yielded anything, so
+    the caller falls back to parsing the homepage.
+    """
+    if DISCOVERY_MODE != "feeds" or not feeds:
+        return None
+
+    since = reference_time() - timedelta(hours=max_age_hours)
+    entries, children, size = _read_feeds(feeds, since)
+    if children:
+        children.sort(key=lambda child: child[1] or since, reverse=True)
+        nested, _, nested_size = _read_feeds([url for url, _ in children[:MAX_CHILD_SITEMAPS]], since)
+        entries.extend(nested)
+        size += nested_size
+
+    if not entries:
+        logger.info(f"[{source}] No feed entries found, falling back to homepage parsing")
+        return None
+
+    recent = [(url.strip(), published) for url, published in entries if published is None or published >= since]
+    recent.sort(key=lambda entry: entry[1] or since, reverse=True)
+    urls = [url for url in dict.fromkeys(url for url, _ in recent) if url_filter is None or url_filter(url)]
+    logger.info(f"[{source}] Discovered {len(urls)} recent URLs from feeds ({size / 1024:.0f} KB read, {len(entries)} entries)")
+    return urls
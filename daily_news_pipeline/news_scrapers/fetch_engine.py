@@ -0,0 +1,224 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from . import replay
+from .http_cache import get_http_cache
+from .rate_limiter import (
+    MAX_RETRIES,
+    MAX_RETRY_AFTER,
+    RETRY_STATUSES,
+    THROTTLE_STATUSES,
+    backoff_delay,
+    get_rate_limiter,
+    parse_retry_after,
+)
+
+
+# ------------------- CONFIGURATION -------------------
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+TIMEOUT = 30
+PER_HOST_CONCURRENCY = 4    # Simultaneous connections to a single site
+
+logger = logging.getLogger(__name__)
+
+
+# ------------------- RESULT -------------------
+
+@dataclass
+class FetchResult:
+    """Outcome of fetching one URL; `error` is set instead of raising."""
+    url: str
+    status_code: Optional[int] = None
+    content: bytes = b""
+    encoding: Optional[str] = None
+    final_url: Optional[str] = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+    from_cache: bool = False  # Body reused from the HTTP cache after a 304
+
+    @property
+    def ok(self):
+        return self.error is None and self.status_code is not None and 200 <= self.status_code < 300
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+
+# ------------------- ENGINE -------------------
+
+class FetchEngine:
+    """Fetches many URLs concurrently over one HTTP client.
+
+    Each host gets its own semaphore (bounded concurrency) and is paced by
+    the process-wide adaptive rate limiter, so unrelated sites never slow
+    each other down while 429/503s and slow responses back a site off.
+    Transport errors and 429/5xx are retried with jittered exponential
+    backoff, honoring Retry-After. With an HTTP cache, requests for cached
+    URLs are conditional and a 304 is answered from the cached body.
+    Traffic is recorded or replayed when a replay session is active.
+    """
+
+    def __init__(self, headers=None, timeout=TIMEOUT, per_host_concurrency=PER_HOST_CONCURRENCY,
+                 max_retries=MAX_RETRIES, rate_limiter=None, cache=None):
+        self.headers = {**DEFAULT_HEADERS, **(headers or {})}
+        self.timeout = timeout
+        self.per_host_concurrency = per_host_concurrency
+        self.max_retries = max_retries
+        self.replaying = replay.get_replay() is not None  # Recorded traffic: no pacing, no backoff sleeps
+        self.rate_limiter = rate_limiter or (replay.Unpaced() if self.replaying else get_rate_limiter())
+        if cache is None and not replay.is_active():  # Recordings need full bodies, not 304s
+            cache = get_http_cache()
+        self.cache = cache or None  # cache=False disables it
+        self._hosts = {}
+        self._client = None
+
+    async def __aenter__(self):
+        self._client = httpx.AsyncClient(
+            headers=self.headers,
+            timeout=self.timeout,
+            follow_redirects=True,
+            transport=replay.http_transport(),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._client.aclose()
+        self._client = None
+
+    def _host_limits(self, url):
+        host = urlsplit(url).netloc.lower()
+        if host not in self._hosts:
+            self._hosts[host] = (asyncio.Semaphore(self.per_host_concurrency), self.rate_limiter.domain(host))
+        return self._hosts[host]
+
+    async def _attempt(self, url, cached, limiter):
+        """One request. Returns (FetchResult, retry): retry is False or the Retry-After delay (0 if none)."""
+        started = time.monotonic()
+        try:
+            response = await self._client.get(url, headers=cached.conditional_headers() if cached else None)
+        except httpx.TransportError as e:
+            limiter.record_failure()
+            return FetchResult(url=url, error=f"{type(e).__name__}: {e}"), 0
+        except httpx.HTTPError as e:
+            return FetchResult(url=url, error=f"{type(e).__name__}: {e}"), False
+        latency = time.monotonic() - started
+        status = response.status_code
+
+        if status in THROTTLE_STATUSES:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None and retry_after > MAX_RETRY_AFTER:
+                # Too long to wait out mid-run: give up on this URL, back the site off as usual
+                limiter.record_throttle()
+                return FetchResult(url=url, status_code=status, error=f"HTTP {status} for {url} (Retry-After {retry_after:.0f}s)"), False
+            limiter.record_throttle(retry_after)
+            return FetchResult(url=url, status_code=status, error=f"HTTP {status} for {url}"), retry_after or 0
+        if status >= 500:
+            limiter.record_failure()
+        else:
+            limiter.record_success(latency)
+
+        if cached and status == 304:
+            self.cache.revalidated(cached)
+            return FetchResult(
+                url=url,
+                status_code=200,
+                content=cached.content,
+                encoding=cached.encoding,
+                final_url=cached.final_url,
+                from_cache=True,
+            ), False
+        if status >= 400:
+            return FetchResult(url=url, status_code=status, error=f"HTTP {status} for {url}"), 0 if status in RETRY_STATUSES else False
+
+        if self.cache and status == 200:
+            self.cache.store(
+                url,
+                response.content,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                encoding=response.encoding,
+                final_url=str(response.url),
+            )
+        return FetchResult(
+            url=url,
+            status_code=status,
+            content=response.content,
+            encoding=response.encoding,
+            final_url=str(response.url),
+        ), False
+
+    async def fetch(self, url):
+        semaphore, limiter = self._host_limits(url)
+        cached = self.cache.lookup(url) if self.cache else None
+        started = time.monotonic()
+        for attempt in range(self.max_retries + 1):
+            async with semaphore:
+                await limiter.acquire()
+                result, retry = await self._attempt(url, cached, limiter)
+            if retry is False or attempt == self.max_retries:
+                break
+            # The limiter already holds the whole site back for Retry-After; this spreads retries out
+            delay = 0 if self.replaying else backoff_delay(attempt)
+            logger.info(f"Retrying {url} in {max(delay, retry):.1f}s (attempt {attempt + 2}/{self.max_retries + 1}): {result.error}")
+            await asyncio.sleep(delay)
+        result.elapsed = time.monotonic() - started
+
+        if result.ok:
+            source = "cache (304)" if result.from_cache else f"Status {result.status_code}"
+            logger.debug(f"Fetched {url}: {source}, Size {len(result.content)} bytes, {result.elapsed:.2f}s")
+        else:
+            logger.warning(f"Fetch failed for {url}: {result.error}")
+        return result
+
+    async def fetch_all(self, urls):
+        """Fetches every URL concurrently; returns {url: FetchResult} in input order."""
+        unique_urls = list(dict.fromkeys(urls))
+        results = await asyncio.gather(*(self.fetch(url) for url in unique_urls))
+        return dict(zip(unique_urls, results))
+
+
+# ------------------- SYNC ENTRY POINTS -------------------
+
+def _run(coro):
+    """Runs a coroutine to completion from synchronous scraper code."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # Called from inside an event loop: run on a private loop in a worker thread.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def fetch_pages(urls, **engine_options):
+    """Fetches a list of URLs concurrently and returns {url: FetchResult}."""
+    urls = list(urls)
+    if not urls:
+        return {}
+
+    async def _fetch():
+        async with FetchEngine(**engine_options) as engine:
+            return await engine.fetch_all(urls)
+
+    started = time.monotonic()
+    results = _run(_fetch())
+    failed = sum(1 for result in results.values() if not result.ok)
+    cached = sum(1 for result in results.values() if result.from_cache)
+    logger.info(f"Fetched {len(results)} pages ({failed} failed, {cached} unchanged from cache) in {time.monotonic() - started:.2f}s")
+    return results
+
+
+def fetch_page(url, **engine_options):
+    """Fetches a single URL through the engine and returns its FetchResult."""
+    return fetch_pages([url], **engine_options)[url]
@@ -0,0 +1,139 @@
+import logging
+import os
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax is optional
+    LexborHTMLParser = None
+
+try:
+    import lxml  # noqa: F401  (only needed as a BeautifulSoup tree builder)
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+
+# ------------------- CONFIGURATION -------------------
+
+BACKENDS = ("selectolax", "lxml", "html.parser")
+
+logger = logging.getLogger(__name__)
+
+
+def available_backends():
+    """Backends usable in this environment, fastest first."""
+    return [
+        backend for backend in BACKENDS
+        if (backend != "selectolax" or LexborHTMLParser is not None) and (backend != "lxml" or HAS_LXML)
+    ]
+
+
+def _default_backend():
+    requested = os.getenv("SCRAPER_HTML_PARSER")
+    available = available_backends()
+    if requested:
+        if requested in available:
+            return requested
+        logger.warning(f"HTML parser backend '{requested}' is not available, using '{available[0]}'")
+    return available[0]
+
+
+DEFAULT_BACKEND = _default_backend()
+
+
+# ------------------- NODES -------------------
+# Scrapers only talk to these wrappers: CSS selectors in, text and attributes out.
+# Both implementations follow BeautifulSoup's get_text() semantics, so a
+# selector gives the same text whichever backend parsed the page.
+
+class SoupNode:
+    """A BeautifulSoup element (lxml or html.parser tree builder)."""
+    __slots__ = ("el",)
+
+    def __init__(self, el):
+        self.el = el
+
+    def select(self, css):
+        return [SoupNode(el) for el in self.el.select(css)]
+
+    def select_one(self, css):
+        el = self.el.select_one(css)
+        return SoupNode(el) if el is not None else None
+
+    def text(self, strip=False, separator=""):
+        return self.el.get_text(separator, strip=strip)
+
+    def get(self, attr, default=None):
+        value = self.el.get(attr, default)
+        return " ".join(value) if isinstance(value, list) else value
+
+
+class LexborNode:
+    """A selectolax (lexbor) element."""
+    __slots__ = ("el",)
+
+    def __init__(self, el):
+        self.el = el
+
+    def select(self, css):
+        return [LexborNode(el) for el in self.el.css(css)]
+
+    def select_one(self, css):
+        el = self.el.css_first(css)
+        return LexborNode(el) if el is not None else None
+
+    def text(self, strip=False, separator=""):
+        return self.el.text(deep=True, separator=separator, strip=strip)
+
+    def get(self, attr, default=None):
+        value = self.el.attributes.get(attr, default) if hasattr(self.el, "attributes") else default
+        return default if value is None else value
+
+
+# ------------------- TARGETED PARSING -------------------
+
+class AnyOf(SoupStrainer):
+    """SoupStrainer that keeps a tag (with its whole subtree) if any of `strainers` would."""
+
+    def __init__(self, strainers):
+        super().__init__()
+        self.strainers = strainers
+
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        # Tree builders hand over class as one raw string; split it so
+        # ("span", {"class": "author"}) matches class="author vcard" like find() does.
+        if attrs and isinstance(attrs.get("class"), str):
+            attrs = {**attrs, "class": attrs["class"].split()}
+        return any(strainer.allow_tag_creation(nsprefix, name, attrs) for strainer in self.strainers)
+
+    def allow_string_creation(self, string):
+        return False
+
+
+def targets(*filters):
+    """
+    Builds a parse-only filter from SoupStrainer-style (name, attrs) pairs, e.g.
+    targets(("h1", {"class": "entry-title"}), ("div", {"class": "entry-content"})).
+
+    Only matching elements and their subtrees are built into the tree, so
+    selectors must not depend on ancestors outside those subtrees.
+    """
+    return AnyOf([SoupStrainer(name, attrs or {}) for name, attrs in filters])
+
+
+def parse_html(markup, only=None, backend=None):
+    """
+    Parses markup with the chosen backend (default: fastest available, or
+    the SCRAPER_HTML_PARSER env var) and returns the document node.
+
+    `only` (from `targets()`) restricts BeautifulSoup backends to the needed
+    subtrees; selectolax always parses the full page, which is still faster.
+    """
+    backend = backend or DEFAULT_BACKEND
+    if backend == "selectolax":
+        return LexborNode(LexborHTMLParser(markup))
+    if backend not in ("lxml", "html.parser"):
+        raise ValueError(f"Unknown HTML parser backend: {backend}")
+    return SoupNode(BeautifulSoup(markup, backend, parse_only=only))
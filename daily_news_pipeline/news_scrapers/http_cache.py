@@ -0,0 +1,157 @@
+import logging
+import os
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from utils.sqlite_store import LruStore
+
+
+# ------------------- CONFIGURATION -------------------
+
+CACHE_FILE = Path(__file__).resolve().parent / "news_articles_data" / "http_cache.db"
+ENABLED = os.getenv("HTTP_CACHE", "1") != "0"
+MAX_BYTES = int(float(os.getenv("HTTP_CACHE_MAX_MB", "200")) * 1024 * 1024)  # Compressed bodies kept on disk
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    encoding TEXT,
+    final_url TEXT,
+    body BLOB NOT NULL,
+    body_size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses (last_used);
+"""
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    content: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    encoding: Optional[str] = None
+    final_url: Optional[str] = None
+
+    def conditional_headers(self):
+        """Validators to send so the origin can answer 304 Not Modified."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+# ------------------- CACHE -------------------
+
+class HttpCache(LruStore):
+    """
+    Persistent conditional-GET cache for the fetch engine.
+
+    Only 200 responses carrying an ETag or Last-Modified are stored, with
+    their body zlib-compressed in SQLite. Later fetches revalidate with
+    If-None-Match / If-Modified-Since and reuse the stored body on 304.
+    Least recently used entries are evicted once the compressed total
+    passes `max_bytes`.
+    """
+
+    SCHEMA = SCHEMA
+    SYNCHRONOUS = "NORMAL"
+    TABLE, KEY, SIZE, SIZED_COLUMNS = "responses", "url", "{row}.stored_size", ("stored_size",)
+    NAME = "HTTP cache"
+
+    def __init__(self, path=CACHE_FILE, max_bytes=MAX_BYTES):
+        self._lock = threading.Lock()
+        self._stats = {"lookups": 0, "hits": 0, "stores": 0, "evicted": 0, "bytes_saved": 0}
+        super().__init__(path, max_bytes)
+
+    def _count(self, **increments):
+        with self._lock:
+            for key, value in increments.items():
+                self._stats[key] += value
+
+    def lookup(self, url):
+        """Returns the cached response for a URL, or None."""
+        self._count(lookups=1)
+        row = self._connection().execute(
+            "SELECT etag, last_modified, encoding, final_url, body FROM responses WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, encoding, final_url, body = row
+        try:
+            content = zlib.decompress(body)
+        except zlib.error:
+            logger.warning(f"Dropping corrupt cache entry for {url}")
+            self.delete(url)
+            return None
+        return CachedResponse(url, content, etag, last_modified, encoding, final_url)
+
+    def revalidated(self, cached):
+        """Records a 304 for a cached response and refreshes its recency."""
+        self._count(hits=1, bytes_saved=len(cached.content))
+        with self._connection() as conn:
+            conn.execute("UPDATE responses SET last_used = ? WHERE url = ?", (time.time(), cached.url))
+
+    def store(self, url, content, etag=None, last_modified=None, encoding=None, final_url=None):
+        """Stores a response body if it carries a validator; evicts if over budget."""
+        if not (etag or last_modified):
+            return
+        body = zlib.compress(content, 6)
+        with self._connection() as conn:
+            conn.execute(
+                """INSERT INTO responses
+                   (url, etag, last_modified, encoding, final_url, body, body_size, stored_size, last_used)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(url) DO UPDATE SET
+                       etag = excluded.etag, last_modified = excluded.last_modified, encoding = excluded.encoding,
+                       final_url = excluded.final_url, body = excluded.body, body_size = excluded.body_size,
+                       stored_size = excluded.stored_size, last_used = excluded.last_used""",
+                (url, etag, last_modified, encoding, final_url, body, len(content), len(body), time.time()),
+            )
+        self._count(stores=1, evicted=self._evict())
+
+    def delete(self, url):
+        with self._connection() as conn:
+            conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+
+    def stats(self):
+        """Counters for this process plus the derived hit rate."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["hit_rate"] = stats["hits"] / stats["lookups"] if stats["lookups"] else 0.0
+        return stats
+
+    def log_stats(self):
+        stats = self.stats()
+        logger.info(
+            f"HTTP cache: {stats['hits']}/{stats['lookups']} revalidated ({stats['hit_rate']:.0%}), "
+            f"{stats['bytes_saved'] / 1024 / 1024:.1f} MB not re-downloaded, "
+            f"{stats['stores']} stored, {stats['evicted']} evicted"
+        )
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache():
+    """Returns the process-wide HTTP cache, or None when disabled with HTTP_CACHE=0."""
+    global _cache
+    if not ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = HttpCache()
+        return _cache
@@ -0,0 +1,119 @@
+"""
+Micro-benchmark of the HTML parser backends over saved article pages.
+
+Pages are read from <pages_dir>/<site>/*.html, where <site> is one of SITES.
+Each page is parsed with every available backend, both in full and
+restricted to the site profile's article targets, and the profile's selectors
+are run on the result. Reports mean parse + extract time per article.
+
+    python -m daily_news_pipeline.news_scrapers.parser_benchmark saved_pages
+    python -m daily_news_pipeline.news_scrapers.parser_benchmark saved_pages --save hiphopdx https://hiphopdx.com/news/...
+"""
+
+import argparse
+import hashlib
+import statistics
+import time
+from pathlib import Path
+
+from .fetch_engine import fetch_pages
+from .html_parser import available_backends, parse_html
+from .site_profiles import PROFILES
+
+
+# ------------------- CONFIGURATION -------------------
+
+# site directory -> (subtree filter, selectors the scraper reads from an article page)
+SITES = {
+    name: (profile.article_targets, profile.article.css())
+    for name, profile in PROFILES.items()
+    if profile.article_targets is not None
+}
+REPEAT = 5  # Timed runs per page and configuration; the best one is kept
+
+
+def extract(markup, backend, only, selectors):
+    doc = parse_html(markup, only=only, backend=backend)
+    return [node.text(strip=True) for css in selectors for node in doc.select(css)]
+
+
+def time_page(markup, backend, only, selectors, repeat=REPEAT):
+    """Best-of-`repeat` seconds to parse one page and run its selectors."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        extract(markup, backend, only, selectors)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def load_pages(pages_dir):
+    """Returns {site: [markup, ...]} for every known site directory under pages_dir."""
+    pages = {}
+    for site in SITES:
+        files = sorted((Path(pages_dir) / site).glob("*.html"))
+        if files:
+            pages[site] = [f.read_text(encoding="utf-8", errors="replace") for f in files]
+    return pages
+
+
+def save_pages(pages_dir, site, urls):
+    """Fetches article URLs and stores them as <pages_dir>/<site>/<hash>.html."""
+    site_dir = Path(pages_dir) / site
+    site_dir.mkdir(parents=True, exist_ok=True)
+    for url, page in fetch_pages(urls).items():
+        if page.ok:
+            name = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+            (site_dir / f"{name}.html").write_text(page.text, encoding="utf-8")
+            print(f"Saved {url}")
+        else:
+            print(f"Skipped {url}: {page.error}")
+
+
+def run_benchmark(pages_dir, repeat=REPEAT):
+    pages = load_pages(pages_dir)
+    if not pages:
+        print(f"No saved pages under {pages_dir} (expected <site>/*.html with site in {', '.join(SITES)})")
+        return
+
+    configs = []
+    for backend in available_backends():
+        configs.append((backend, "full"))
+        if backend != "selectolax":  # selectolax has no subtree filter
+            configs.append((backend, "targeted"))
+
+    print(f"{'site':<16} {'pages':>5}  " + "  ".join(f"{b + '/' + m:>22}" for b, m in configs))
+    for site, markups in pages.items():
+        only, selectors = SITES[site]
+        reference = [extract(markup, "html.parser", None, selectors) for markup in markups]
+        cells = []
+        for backend, mode in configs:
+            target = only if mode == "targeted" else None
+            mean_ms = statistics.mean(time_page(m, backend, target, selectors, repeat) for m in markups) * 1000
+            matches = sum(
+                extract(markup, backend, target, selectors) == expected
+                for markup, expected in zip(markups, reference)
+            )
+            cells.append(f"{mean_ms:>9.2f} ms ({matches}/{len(markups)} ok)")
+        print(f"{site:<16} {len(markups):>5}  " + "  ".join(f"{cell:>22}" for cell in cells))
+    print("Times are mean parse + extract per article; 'ok' = same text as the html.parser full parse.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML parser backends on saved article pages.")
+    parser.add_argument("pages_dir", help="Directory holding <site>/*.html pages")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="Timed runs per page (best is kept)")
+    parser.add_argument("--save", nargs="+", metavar=("SITE", "URL"),
+                        help="Fetch and save article URLs for SITE before benchmarking")
+    args = parser.parse_args()
+
+    if args.save:
+        site, *urls = args.save
+        if site not in SITES:
+            parser.error(f"Unknown site '{site}', expected one of: {', '.join(SITES)}")
+        save_pages(args.pages_dir, site, urls)
+    run_benchmark(args.pages_dir, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+# ------------------- CONFIGURATION -------------------
+
+INITIAL_RATE = 2.0      # Requests per second a new site starts at
+MIN_RATE = 0.2
+MAX_RATE = 10.0
+BURST = 4               # Requests an idle site may receive back to back
+RATE_INCREASE = 0.1     # Additive increase per healthy response (req/s)
+RATE_DECREASE = 0.5     # Multiplicative decrease on 429/503 or errors
+SLOW_FACTOR = 3.0       # A response this many times slower than the site's best counts as overload
+SLOW_FLOOR = 1.0        # ... but never below this many seconds
+MAX_RETRIES = 3         # Extra attempts for transient failures
+BACKOFF_BASE = 1.0      # Seconds; attempt n waits up to BACKOFF_BASE * 2**n (full jitter)
+BACKOFF_MAX = 30.0
+MAX_RETRY_AFTER = 60.0  # A longer Retry-After fails the URL instead of stalling the site
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+THROTTLE_STATUSES = {429, 503}
+
+logger = logging.getLogger(__name__)
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date), or None."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(attempt, base=BACKOFF_BASE, cap=BACKOFF_MAX):
+    """Full-jitter exponential backoff for retry number `attempt` (0-based)."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+# ------------------- PER-DOMAIN LIMITER -------------------
+
+class DomainLimiter:
+    """
+    Adaptive request pacing for one site (AIMD).
+
+    Requests are spaced 1/rate apart, with up to `burst` allowed at once
+    after an idle period. Healthy responses raise the rate additively;
+    429/503, errors and responses much slower than the site's best cut it
+    multiplicatively. Retry-After pauses the site for everyone.
+
+    State is guarded by a thread lock rather than asyncio primitives, so one
+    limiter paces every fetch engine (and event loop) in the process.
+    """
+
+    def __init__(self, host, rate=INITIAL_RATE, burst=BURST):
+        self.host = host
+        self.rate = rate
+        self.burst = burst
+        self.best_latency = None
+        self._next_slot = 0.0
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Claims the next request slot; returns seconds to wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(self._next_slot, now - (self.burst - 1) / self.rate, self._paused_until)
+            self._next_slot = start + 1 / self.rate
+            return max(0.0, start - now)
+
+    async def acquire(self):
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+    def _set_rate(self, rate, reason=None):
+        old, self.rate = self.rate, min(MAX_RATE, max(MIN_RATE, rate))
+        if reason and self.rate != old:
+            logger.info(f"[{self.host}] Rate {old:.2f} -> {self.rate:.2f} req/s ({reason})")
+
+    def record_success(self, latency):
+        with self._lock:
+            self.best_latency = latency if self.best_latency is None else min(self.best_latency, latency)
+            if latency > max(SLOW_FLOOR, SLOW_FACTOR * self.best_latency):
+                self._set_rate(self.rate * RATE_DECREASE, f"slow response {latency:.1f}s")
+            else:
+                self._set_rate(self.rate + RATE_INCREASE)
+
+    def record_throttle(self, retry_after=None):
+        """A 429/503: halve the rate and pause the site for Retry-After (or one slot)."""
+        with self._lock:
+            self._set_rate(self.rate * RATE_DECREASE, "throttled")
+            pause = retry_after if retry_after is not None else 1 / self.rate
+            self._paused_until = max(self._paused_until, time.monotonic() + pause)
+        logger.warning(f"[{self.host}] Throttled, pausing {pause:.1f}s")
+
+    def record_failure(self):
+        with self._lock:
+            self._set_rate(self.rate * RATE_DECREASE, "error")
+
+
+class RateLimiter:
+    """Registry of per-domain limiters shared by every fetch in the process."""
+
+    def __init__(self, rate=INITIAL_RATE, burst=BURST):
+        self.rate = rate
+        self.burst = burst
+        self._domains = {}
+        self._lock = threading.Lock()
+
+    def domain(self, host):
+        with self._lock:
+            if host not in self._domains:
+                self._domains[host] = DomainLimiter(host, self.rate, self.burst)
+            return self._domains[host]
+
+    def rates(self):
+        """Current requests/second per host."""
+        with self._lock:
+            return {host: limiter.rate for host, limiter in self._domains.items()}
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """Returns the process-wide rate limiter."""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = RateLimiter()
+        return _limiter
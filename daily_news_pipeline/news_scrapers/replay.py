@@ -0,0 +1,311 @@
+"""
+Record and replay of scraper traffic.
+
+A recording is a gzip-compressed JSONL archive in the spirit of WARC: a
+`warcinfo` header followed by one record per HTTP exchange (`response`),
+per browser render (`render`) and per piece of run metadata (`metadata`).
+Response bodies are stored raw (still content-encoded) and base64-encoded,
+so a replay sees exactly the bytes the live site sent.
+
+While recording, the fetch engine's client goes through RecordingTransport
+and the browser pool logs every render. While replaying, ReplayTransport
+answers from the archive (404 for anything not recorded), renders come from
+the archive, and no request leaves the machine. Both modes bypass the HTTP
+cache so every body is real.
+
+    SCRAPER_RECORD=run.jsonl.gz python main.py    # record a live run
+    SCRAPER_REPLAY=run.jsonl.gz python main.py    # run it again offline
+"""
+
+import atexit
+import base64
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+
+
+# ------------------- CONFIGURATION -------------------
+
+ARCHIVE_DIR = Path(__file__).resolve().parent / "news_articles_data" / "recordings"
+RECORD_TO = os.getenv("SCRAPER_RECORD")     # Archive path to record this process's traffic into
+REPLAY_FROM = os.getenv("SCRAPER_REPLAY")   # Archive path to serve this process's traffic from
+
+logger = logging.getLogger(__name__)
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+# ------------------- ARCHIVE -------------------
+
+class ArchiveWriter:
+    """Appends records to a gzip JSONL archive; safe to share between threads."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = gzip.open(self.path, "wt", encoding="utf-8")
+        self.write({"type": "warcinfo", "date": _now(), "software": "daily_news_pipeline.news_scrapers.replay"})
+        logger.info(f"Recording scraper traffic to {self.path}")
+
+    def write(self, record):
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            if self._file is not None:
+                self._file.write(line)
+
+    def write_response(self, request, response, body, elapsed):
+        self.write({
+            "type": "response",
+            "uri": str(request.url),
+            "method": request.method,
+            "date": _now(),
+            "status": response.status_code,
+            "headers": [[name, value] for name, value in response.headers.multi_items()],
+            "body": base64.b64encode(body).decode("ascii"),
+            "elapsed": round(elapsed, 4),
+        })
+
+    def write_render(self, url, html):
+        self.write({"type": "render", "uri": url, "date": _now(), "body": html})
+
+    def write_metadata(self, name, data):
+        self.write({"type": "metadata", "name": name, "date": _now(), "data": data})
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class Archive:
+    """
+    A recording loaded for replay.
+
+    A URL fetched several times during recording (retries, revisits) is
+    answered with its recorded responses in order, then the last one again.
+    `stats` counts what the replay has served so far.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.recorded_at = None
+        self.metadata = {}
+        self._responses = defaultdict(list)
+        self._renders = {}
+        self._served = defaultdict(int)
+        self._lock = threading.Lock()
+        self.stats = {"responses": 0, "renders": 0, "bytes": 0, "misses": 0}
+
+        for record in self._read():
+            kind = record.get("type")
+            if kind == "warcinfo":
+                self.recorded_at = datetime.fromisoformat(record["date"])
+            elif kind == "response":
+                self._responses[(record["method"], record["uri"])].append(record)
+            elif kind == "render":
+                self._renders[record["uri"]] = record["body"]
+            elif kind == "metadata":
+                self.metadata[record["name"]] = record["data"]
+        logger.info(f"Replaying {sum(map(len, self._responses.values()))} responses and {len(self._renders)} renders from {self.path}")
+
+    def _read(self):
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue  # Torn last line from an interrupted recording
+        except (EOFError, gzip.BadGzipFile, zlib.error):
+            logger.warning(f"Recording {self.path} is truncated; replaying what was read")
+
+    def _count(self, **increments):
+        with self._lock:
+            for key, value in increments.items():
+                self.stats[key] += value
+
+    def response(self, method, url):
+        """Next recorded (status, headers, raw body) for a request, or None."""
+        records = self._responses.get((method, url))
+        if not records:
+            self._count(misses=1)
+            return None
+        with self._lock:
+            index = min(self._served[(method, url)], len(records) - 1)
+            self._served[(method, url)] += 1
+        record = records[index]
+        body = base64.b64decode(record["body"])
+        self._count(responses=1, bytes=len(body))
+        return record["status"], record["headers"], body
+
+    def render(self, url):
+        if url not in self._renders:
+            self._count(misses=1)
+            return None
+        html = self._renders[url]
+        self._count(renders=1, bytes=len(html.encode("utf-8")) if html else 0)
+        return html
+
+
+# ------------------- TRANSPORTS -------------------
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Sends requests over a real transport and writes every exchange to the archive."""
+
+    def __init__(self, writer, transport=None):
+        self.writer = writer
+        self._transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request):
+        started = time.monotonic()
+        response = await self._transport.handle_async_request(request)
+        try:
+            body = b"".join([chunk async for chunk in response.aiter_raw()])
+        finally:
+            await response.aclose()
+        self.writer.write_response(request, response, body, time.monotonic() - started)
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            content=body,
+            extensions=response.extensions,
+            request=request,
+        )
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Answers requests from an archive; anything not recorded gets a 404."""
+
+    def __init__(self, archive):
+        self.archive = archive
+
+    async def handle_async_request(self, request):
+        recorded = self.archive.response(request.method, str(request.url))
+        if recorded is None:
+            logger.warning(f"No recorded response for {request.method} {request.url}")
+            return httpx.Response(404, headers={"X-Replay": "miss"}, request=request)
+        status, headers, body = recorded
+        return httpx.Response(status, headers=headers, content=body, request=request)
+
+
+class Unpaced:
+    """Stands in for the rate limiter (and its per-domain limiters) during replay."""
+
+    def domain(self, host):
+        return self
+
+    async def acquire(self):
+        pass
+
+    def record_success(self, latency):
+        pass
+
+    def record_throttle(self, retry_after=None):
+        pass
+
+    def record_failure(self):
+        pass
+
+
+# ------------------- SESSION -------------------
+
+_session = None         # ArchiveWriter while recording, Archive while replaying
+_configured = False     # Whether SCRAPER_RECORD / SCRAPER_REPLAY have been applied
+_session_lock = threading.Lock()
+
+
+def _close(session):
+    if isinstance(session, ArchiveWriter):
+        session.close()
+        logger.info(f"Recording saved to {session.path}")
+
+
+def _current():
+    global _session, _configured
+    with _session_lock:
+        if not _configured:
+            _configured = True
+            if REPLAY_FROM:
+                _session = Archive(REPLAY_FROM)
+            elif RECORD_TO:
+                _session = ArchiveWriter(RECORD_TO)
+        return _session
+
+
+def start_recording(path):
+    """Records all scraper traffic of this process into `path` until stop()."""
+    global _session, _configured
+    with _session_lock:
+        _close(_session)
+        _session, _configured = ArchiveWriter(path), True
+        return _session
+
+
+def start_replay(path):
+    """Serves all scraper traffic of this process from the archive at `path` until stop()."""
+    global _session, _configured
+    with _session_lock:
+        _close(_session)
+        _session, _configured = Archive(path), True
+        return _session
+
+
+def stop():
+    """Ends recording or replay; scrapers go back to the live network."""
+    global _session, _configured
+    with _session_lock:
+        _close(_session)
+        _session, _configured = None, True
+
+
+def get_recorder():
+    """The active ArchiveWriter, or None when not recording."""
+    session = _current()
+    return session if isinstance(session, ArchiveWriter) else None
+
+
+def get_replay():
+    """The Archive being replayed, or None when not replaying."""
+    session = _current()
+    return session if isinstance(session, Archive) else None
+
+
+def is_active():
+    return _current() is not None
+
+
+def http_transport():
+    """A transport for a new fetch-engine client, or None for the default network transport."""
+    session = _current()
+    if isinstance(session, Archive):
+        return ReplayTransport(session)
+    if isinstance(session, ArchiveWriter):
+        return RecordingTransport(session)
+    return None
+
+
+def reference_time():
+    """Now, or the recording's start time while replaying, for age cut-offs that must repeat."""
+    archive = get_replay()
+    if archive is not None and archive.recorded_at is not None:
+        return archive.recorded_at
+    return datetime.now(timezone.utc)
+
+
+atexit.register(stop)
@@ -0,0 +1,128 @@
+"""
+End-to-end scraper benchmark over recorded traffic.
+
+`--record` runs each scraper live and saves its traffic, plus the articles
+it extracted, as <dir>/<site>.jsonl.gz (see replay.py). Without it, each
+scraper is run again against its recording, offline and unthrottled, and
+the run is compared with the recorded one:
+
+    pages/s      responses + renders served per second of wall time
+    KB           body bytes served from the recording
+    cpu ms/art   process CPU time per article; with the network replayed
+                 this is parsing and extraction
+    correct      articles identical (all fields) to the recorded run
+    misses       requests the recording had no answer for (behaviour drift)
+
+Every run uses a throwaway article database and crawl journal directory,
+so the real store is never read or written.
+
+    python -m daily_news_pipeline.news_scrapers.scraper_benchmark --record
+    python -m daily_news_pipeline.news_scrapers.scraper_benchmark allhiphop hiphopdx
+"""
+
+import argparse
+import tempfile
+import time
+import traceback
+from pathlib import Path
+
+from . import crawl_journal, replay
+from .article_store import ARTICLE_FIELDS, ArticleStore, get_article_store, set_article_store
+from .site_profiles import PROFILES
+from .site_scraper import scrape_site
+
+
+def archive_path(archive_dir, site):
+    return Path(archive_dir) / f"{site}.jsonl.gz"
+
+
+def run_site(site, path, record=False):
+    """Runs one scraper while recording to / replaying from `path`; returns its metrics."""
+    store = get_article_store()
+    offset = store.db.count()
+    session = replay.start_recording(path) if record else replay.start_replay(path)
+    error = None
+    started, cpu_started = time.perf_counter(), time.process_time()
+    try:
+        scrape_site(PROFILES[site])
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        traceback.print_exc()
+    finally:
+        store.flush()
+        elapsed, cpu = time.perf_counter() - started, time.process_time() - cpu_started
+        articles = store.db.all_articles()[offset:]
+        if record:
+            session.write_metadata("articles", articles)
+        replay.stop()
+
+    result = {"site": site, "seconds": elapsed, "cpu": cpu, "articles": articles, "error": error}
+    if not record:
+        result["stats"] = dict(session.stats)
+        result["expected"] = session.metadata.get("articles")
+    return result
+
+
+def compare(articles, expected):
+    """Returns (identical, missing, extra) counts against the recorded articles."""
+    produced = {article["source_url"]: article for article in articles}
+    recorded = {article["source_url"]: article for article in expected}
+    identical = sum(
+        all(produced[url].get(field) == article.get(field) for field in ARTICLE_FIELDS)
+        for url, article in recorded.items() if url in produced
+    )
+    return identical, len(recorded.keys() - produced.keys()), len(produced.keys() - recorded.keys())
+
+
+def report(results):
+    print(f"{'site':<16} {'pages':>6} {'KB':>8} {'s':>7} {'pages/s':>8} {'articles':>8} {'cpu ms/art':>10} {'correct':>10} {'misses':>6}")
+    for result in results:
+        stats, articles = result["stats"], result["articles"]
+        pages = stats["responses"] + stats["renders"]
+        per_article = result["cpu"] * 1000 / len(articles) if articles else 0.0
+        if result["expected"] is None:
+            correct = "n/a"
+        else:
+            identical, missing, extra = compare(articles, result["expected"])
+            correct = f"{identical}/{len(result['expected'])}" + (f" +{extra}" if extra else "")
+        print(
+            f"{result['site']:<16} {pages:>6} {stats['bytes'] / 1024:>8.0f} {result['seconds']:>7.2f} "
+            f"{pages / result['seconds'] if result['seconds'] else 0:>8.1f} {len(articles):>8} "
+            f"{per_article:>10.2f} {correct:>10} {stats['misses']:>6}"
+            + (f"  ERROR {result['error']}" if result["error"] else "")
+        )
+    print("'correct' = articles identical to the recorded run (+N produced that the recording lacks).")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record scraper traffic, or benchmark scrapers against recordings.")
+    parser.add_argument("sites", nargs="*", metavar="SITE", help=f"Sites to run (default: all of {', '.join(PROFILES)})")
+    parser.add_argument("--record", action="store_true", help="Run live and save recordings instead of replaying")
+    parser.add_argument("--dir", default=str(replay.ARCHIVE_DIR), help="Directory holding <site>.jsonl.gz recordings")
+    args = parser.parse_args()
+
+    unknown = [site for site in args.sites if site not in PROFILES]
+    if unknown:
+        parser.error(f"Unknown site(s) {', '.join(unknown)}, expected: {', '.join(PROFILES)}")
+    sites = args.sites or list(PROFILES)
+    if not args.record:
+        missing = [site for site in sites if not archive_path(args.dir, site).exists()]
+        for site in missing:
+            print(f"No recording for {site} at {archive_path(args.dir, site)}; run with --record first")
+        sites = [site for site in sites if site not in missing]
+
+    with tempfile.TemporaryDirectory(prefix="scraper-benchmark-") as scratch:
+        set_article_store(ArticleStore(Path(scratch) / "articles.db", flush_interval=0, legacy_json=None))
+        crawl_journal.JOURNAL_DIR = Path(scratch) / "crawl_journal"
+        results = [run_site(site, archive_path(args.dir, site), record=args.record) for site in sites]
+
+    if args.record:
+        for result in results:
+            print(f"Recorded {result['site']}: {len(result['articles'])} articles in {result['seconds']:.1f}s "
+                  f"-> {archive_path(args.dir, result['site'])}")
+    elif results:
+        report(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+import hashlib
+import logging
+import math
+import threading
+
+from .article_store import get_article_store
+
+
+# ------------------- CONFIGURATION -------------------
+
+MIN_CAPACITY = 100_000   # URLs the Bloom filter is sized for at least
+ERROR_RATE = 0.001       # Target false-positive rate at capacity
+
+logger = logging.getLogger(__name__)
+
+
+# ------------------- BLOOM FILTER -------------------
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (double hashing on one blake2b digest)."""
+
+    def __init__(self, capacity, error_rate=ERROR_RATE):
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, key):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+# ------------------- SEEN INDEX -------------------
+
+class SeenIndex:
+    """
+    Shared index of URLs the scrapers have already handled.
+
+    Backed by the article store: stored article URLs plus a `seen_urls`
+    table for pages fetched without producing an article. A Bloom filter
+    loaded at startup answers most lookups for new URLs without touching
+    disk; only possible hits are confirmed in SQLite.
+
+    Scrapers `claim()` URLs before fetching them. A claimed URL is skipped by
+    every other scraper while the claim holds; it is persisted once the
+    article is submitted or the page is `mark()`ed. A URL that is neither
+    (a failed fetch) must be `release()`d, so the next run in the same
+    process retries it.
+    """
+
+    def __init__(self, store=None):
+        self.store = store or get_article_store()
+        known = list(self.store.db.seen_urls())
+        self.bloom = BloomFilter(max(MIN_CAPACITY, 2 * len(known)))
+        for url in known:
+            self.bloom.add(url)
+        self._claimed = set()
+        self._lock = threading.Lock()
+        logger.info(f"Seen index loaded {len(known)} URLs ({len(self.bloom.bits) // 1024} KiB filter)")
+
+    def seen(self, url):
+        """True if the URL was handled in an earlier run or claimed in this one."""
+        with self._lock:
+            if url in self._claimed:
+                return True
+        if url not in self.bloom:
+            return False
+        return self.store.db.is_seen(url) or self.store.exists(url)
+
+    def claim(self, urls):
+        """Returns the URLs nobody has seen yet, in order, and reserves them for the caller."""
+        fresh = []
+        for url in dict.fromkeys(urls):
+            if not url or self.seen(url):
+                logger.debug(f"Already seen, skipping: {url}")
+                continue
+            with self._lock:
+                if url in self._claimed:
+                    continue
+                self._claimed.add(url)
+            fresh.append(url)
+        return fresh
+
+    def release(self, urls):
+        """Drops claims on URLs that were neither submitted nor marked, so they can be claimed again."""
+        with self._lock:
+            self._claimed.difference_update(urls)
+
+    def mark(self, urls):
+        """Persists fetched URLs that produced no article (filtered out, not news, ...)."""
+        urls = list(urls)
+        with self._lock:
+            for url in urls:
+                self.bloom.add(url)
+        if self.bloom.count > self.bloom.capacity:
+            logger.warning(f"Seen index holds {self.bloom.count} URLs, over its filter capacity {self.bloom.capacity}")
+        self.store.mark_seen(urls)
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_seen_index():
+    """Returns the process-wide seen-URL index, loading it on first use."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = SeenIndex()
+        return _index
@@ -0,0 +1,259 @@
+"""
+Declarative scraping profiles, one per news source.
+
+A profile says where a site lists its articles and which CSS selectors hold
+each field; site_scraper.py does the fetching, parsing, dedup and saving
+for every site the same way. Adding a source means adding a profile here.
+
+Article URLs are keyed in canonical form (canonical_urls.py), and a page's
+rel=canonical link wins when it points to the same site, so targets keep
+<link rel="canonical">. Browser sites also fill gaps from JSON-LD, so their
+targets (if any) must keep <script type="application/ld+json">.
+
+Field selectors are tried in order and the first non-empty match wins.
+"css@attr" reads an attribute instead of the text. Body selectors name the
+article container; its paragraphs are joined.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from .html_parser import targets
+
+
+# ------------------- PROFILE SCHEMA -------------------
+
+@dataclass
+class Fields:
+    """Selectors for the article fields, relative to a page or a listing item."""
+    title: Tuple[str, ...] = ()
+    author: Tuple[str, ...] = ()
+    date: Tuple[str, ...] = ()
+    body: Tuple[str, ...] = ()
+
+    def css(self):
+        """Every selector as plain CSS (attributes dropped, paragraphs for bodies)."""
+        plain = [selector.partition("@")[0] for selector in self.title + self.author + self.date]
+        return tuple(plain) + tuple(f"{container} p" for container in self.body)
+
+
+@dataclass
+class Links:
+    """
+    One group of article links on a listing page.
+
+    `items` are the anchors themselves, or containers whose first `link`
+    match is the anchor. `teaser` fields are read from the container and
+    used where the article page lacks them. `limit` caps the group.
+    """
+    items: str
+    link: Optional[str] = None
+    limit: Optional[int] = None
+    teaser: Optional[Fields] = None
+
+    @property
+    def css(self):
+        return f"{self.items} {self.link}" if self.link else self.items
+
+
+@dataclass
+class SiteProfile:
+    name: str                                   # Source key: pipeline, discovery logs, crawl journal
+    listing_urls: Tuple[str, ...]               # Pages whose links are scraped when feeds yield nothing
+    links: Tuple[Links, ...]
+    article: Fields
+    feeds: Tuple[str, ...] = ()                 # RSS/Atom feeds and sitemaps, tried before the listings
+    article_targets: Optional[object] = None    # Subtrees parsed on article pages (None: full parse)
+    url_pattern: Optional[str] = None           # Regex article URLs must match
+    strip_query: bool = False                   # Drop ?query from article URLs
+    date_pattern: Optional[str] = None          # Regex picking the date out of a longer string
+    exclude: Dict[str, str] = field(default_factory=dict)  # field -> regex; matching articles are skipped
+    max_articles: int = 100                     # Article URLs admitted per run
+    pages: int = 1                              # Listing pages followed per listing URL ("page/N/")
+    follow: Optional[str] = None                # Links on article pages crawled one level deeper
+    max_depth: int = 0
+    headers: Optional[Dict[str, str]] = None
+    browser: bool = False                       # Pages may need JavaScript; static HTML is still tried first
+    listing_render: Dict[str, object] = field(default_factory=dict)  # BrowserPool.render options
+    article_render: Dict[str, object] = field(default_factory=dict)
+
+
+# ------------------- SITES -------------------
+
+DESKTOP_UA = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
+
+PROFILES = {
+    "allhiphop": SiteProfile(
+        name="allhiphop",
+        feeds=("https://allhiphop.com/feed/", "https://allhiphop.com/news-sitemap.xml"),
+        listing_urls=tuple(
+            f"https://allhiphop.com/{section}/page/1/"
+            for section in ("news", "rumors", "features", "music", "opinion", "exclusives")
+        ),
+        links=(Links("h2", link="a", limit=15),),
+        article=Fields(
+            title=("h1.entry-title",),
+            author=("span.author.vcard",),
+            date=(".entry-date.published",),
+            body=("div.entry-content",),
+        ),
+        article_targets=targets(
+            ("link", {"rel": "canonical"}),
+            ("h1", {"class": "entry-title"}),
+            ("div", {"class": "entry-content"}),
+            (None, {"class": "entry-date"}),
+            ("span", {"class": "vcard"}),
+        ),
+        max_articles=90,
+    ),
+    "hiphopdx": SiteProfile(
+        name="hiphopdx",
+        feeds=("https://hiphopdx.com/feed", "https://hiphopdx.com/news-sitemap.xml"),
+        listing_urls=("https://hiphopdx.com/",),
+        links=(
+            Links("div#featured", link="a.post-thumbnail-inner[href]"),
+            Links("div.grid-item", link="a.post-thumbnail[href]"),
+            Links("div.post-item", link="a.post-thumbnail-inner[href]", teaser=Fields(date=("span.post-time",))),
+            Links("div.slider-item", link="a.post-thumbnail-inner[href]"),
+        ),
+        article=Fields(
+            title=("h1.entry-title",),
+            author=("span.author.vcard", 'meta[name="author"]@content', "span.authors"),
+            date=(
+                "time.post-date.published", "time", 'meta[property="article:published_time"]@content',
+                'meta[name="dc.date"]@content', 'meta[name="date"]@content',
+            ),
+            body=("div.entry-content",),
+        ),
+        article_targets=targets(
+            ("link", {"rel": "canonical"}),
+            ("h1", {"class": "entry-title"}),
+            ("span", {"class": ["vcard", "authors"]}),
+            ("time", None),
+            ("meta", None),
+            ("div", {"class": "entry-content"}),
+            ("div", {"class": "widget-latest-posts"}),
+        ),
+        url_pattern=r"hiphopdx\.com/news",
+        strip_query=True,
+        follow="div.widget-latest-posts.news div.post-item a[href]",  # "Latest News" sidebar
+        max_depth=1,
+    ),
+    "okayplayer": SiteProfile(
+        name="okayplayer",
+        feeds=("https://www.okayplayer.com/feeds/feed.rss", "https://www.okayplayer.com/news-sitemap.xml"),
+        listing_urls=tuple(
+            f"https://www.okayplayer.com/{section}" for section in ("news", "music", "originals", "culture", "cities")
+        ),
+        links=(Links("h3 a", limit=15),),
+        article=Fields(
+            title=("h1 span",),
+            author=("div.social-author a",),
+            date=("div.social-date span",),
+            body=("div.body-description",),
+        ),
+        article_targets=targets(
+            ("link", {"rel": "canonical"}),
+            ("h1", None),
+            ("div", {"class": "body-description"}),
+            ("div", {"class": "social-date"}),
+            ("div", {"class": "social-author"}),
+        ),
+        max_articles=75,
+        headers=DESKTOP_UA,
+    ),
+    "rapradar": SiteProfile(
+        name="rapradar",
+        feeds=("https://rapradar.com/feed/", "https://rapradar.com/news-sitemap.xml"),
+        listing_urls=("https://rapradar.com/",),
+        links=(Links("a.entry_title"),),
+        article=Fields(
+            title=("header h2",),
+            author=("span.author",),
+            date=("span.date",),
+            body=("#entry_content",),
+        ),
+        article_targets=targets(
+            ("link", {"rel": "canonical"}),
+            ("header", None),
+            (None, {"id": "entry_content"}),
+            ("span", {"class": "date"}),
+            ("span", {"class": "author"}),
+        ),
+        date_pattern=r"^[^@]+",  # "July 4, 2025 @ 3:00 pm"
+        headers=DESKTOP_UA,
+    ),
+    "hotnewhiphop": SiteProfile(
+        name="hotnewhiphop",
+        feeds=("https://www.hotnewhiphop.com/rss/news.xml", "https://www.hotnewhiphop.com/news-sitemap.xml"),
+        listing_urls=("https://www.hotnewhiphop.com",),
+        links=(
+            Links('div[class~="lg:basis-3/4"]', link="a[href]"),  # Top story
+            Links('div[class="flex flex-row lg:flex-col gap-4 lg:basis-1/4"] a[href][class*="line-clamp-3"]'),
+            Links('div[class="w-full lg:w-[326px]"] a[href][class*="line-clamp-3"]'),  # Trending
+            Links('div[class="w-full lg:w-1/2 mx-0 lg:mr-4 lg:ml-4 mb-0 mt-4 lg:mt-0"] div[class*="px-4 mb-"][class*="grid"]',
+                  link='a[href][class*="text-base font-semibold"]'),  # Latest news
+            Links('div[class="w-full lg:w-[30%] flex flex-col shrink-0"] div.tag-card-first-item',
+                  link='a[href][class*="text-lg font-semibold"]'),  # Category sections
+            Links('div[class="w-full lg:w-[30%] flex flex-col shrink-0"] div[class*="pl-4 flex relative flex-row"]',
+                  link='a[href][class*="text-base line-clamp-2"]'),
+        ),
+        article=Fields(
+            title=("h1",),
+            # Anchored at <body>, so article pages get a full parse
+            author=("body > div:nth-of-type(1) > header > div > span:nth-of-type(1) > span:nth-of-type(1) > a",),
+            date=("time@datetime", "time", 'span[class*="date"]', 'span[class*="published"]'),
+            body=('div[class*="content"]',),
+        ),
+        exclude={"title": r"song stream|music video", "description": r"new music"},  # Not news
+        headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"},
+    ),
+    "hiphopsince1987": SiteProfile(
+        name="hiphopsince1987",
+        listing_urls=("https://hiphopsince1987.com/",),
+        links=(Links("div.block-item-big", link="h2 a", teaser=Fields(
+            title=("h2 a",),
+            author=("span.heading-author",),
+            date=("span.heading-date",),
+        )),),
+        # Title, author and date come from the listing; only the body is read from the article
+        article=Fields(body=("div.post-entry",)),
+        article_targets=targets(("link", {"rel": "canonical"}), ("div", {"class": "post-entry"})),
+        pages=3,
+    ),
+    "hiphophero": SiteProfile(
+        name="hiphophero",
+        feeds=("https://hiphophero.com/feed/", "https://hiphophero.com/news-sitemap.xml"),
+        listing_urls=("https://hiphophero.com/articles/news/",),
+        links=(Links(".post-list article", link="h2 a"),),
+        article=Fields(
+            title=("h1",),
+            author=("div.post-author a", "span.byline a"),
+            date=("time@datetime", "time"),
+            body=("article", "div.entry-content"),
+        ),
+        browser=True,
+        listing_render={"scroll": 2000, "wait_for": ".post-list article", "settle_ms": 2000},
+        article_render={"wait_for": "h1"},
+    ),
+    "rapup": SiteProfile(
+        name="rapup",
+        feeds=("https://www.rap-up.com/feed", "https://www.rap-up.com/news-sitemap.xml"),
+        listing_urls=tuple(
+            f"https://www.rap-up.com/category/{section}"
+            for section in ("news", "new-music", "exclusives", "music-videos")
+        ),
+        links=(Links("h3 a", limit=15),),
+        article=Fields(
+            title=("h1",),
+            author=("p.by-line a",),
+            date=("p.by-line",),
+            body=(".default-content-wrapper",),
+        ),
+        date_pattern=r"\d{1,2}\.\d{1,2}\.\d{4}",  # "By Name / 07.04.2025"
+        max_articles=60,
+        browser=True,
+        listing_render={"wait_for": "h3 a", "timeout": 30},
+        article_render={"wait_for": ".default-content-wrapper", "timeout": 30},
+    ),
+}
@@ -0,0 +1,360 @@
+"""
+Generic scraping engine driven by the profiles in site_profiles.py.
+
+For every site the same steps run:
+
+1. Article URLs come from the site's feeds and sitemaps. Listing pages are
+   used only when those yield nothing. Listings are fetched statically,
+   and browser sites fall back to rendering.
+2. URLs go through a journaled crawl frontier. The seen index claims them,
+   so no article is fetched twice, within a run or across runs.
+3. Article pages are fetched concurrently by the fetch engine (HTTP cache,
+   per-domain rate limiting) and parsed with the fast parser, restricted
+   to the profile's targets. Browser sites add the structured-data tiers
+   and render only what static HTML misses.
+4. Pages are handled FETCH_BATCH at a time; each batch is stored, and
+   then journaled as done.
+"""
+
+import logging
+import os
+import re
+from datetime import timedelta
+from urllib.parse import urljoin
+
+from dateutil import parser as date_parser
+
+from .article_store import DATE_FORMAT, get_article_store
+from .browser_pool import get_browser_pool
+from .canonical_urls import canonical_url, same_site
+from .crawl_frontier import CrawlFrontier
+from .crawl_journal import CrawlJournal
+from .discovery import discover_urls
+from .fetch_engine import fetch_pages
+from .html_parser import parse_html
+from .replay import reference_time
+from .seen_index import get_seen_index
+from .site_profiles import PROFILES
+from .structured_data import MISSING, fetch_articles_static_first, fill_from_json_ld
+
+
+# ------------------- CONFIGURATION -------------------
+
+LOG_FILE = "log/scraper.log"
+UNKNOWN = "Unknown"  # Placeholder for an author or date that could not be read
+BOILERPLATE = re.compile(r"AD\s+LOADING\.\.\.")
+DATE_PREFIX = re.compile(r"^(?:published|posted|updated)(?:\s+on)?\s*:?\s*", re.IGNORECASE)
+RELATIVE_DATE = re.compile(r"^(?:(\d+)|an?)\s+(minute|hour|day|week)s?\s+ago$", re.IGNORECASE)
+YEAR = re.compile(r"\d{4}")
+CANONICAL_LINK = 'link[rel="canonical"]@href'
+FETCH_BATCH = 16        # Article pages fetched, stored and journaled together; bounds the work an interrupted run loses
+
+os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.FileHandler(LOG_FILE, encoding="utf-8"), logging.StreamHandler()],
+)
+logger = logging.getLogger(__name__)
+
+
+# ------------------- FIELD EXTRACTION -------------------
+
+def clean_text(text):
+    return re.sub(r"\s+", " ", BOILERPLATE.sub("", text or "")).strip()
+
+
+def parse_date(raw, pattern=None):
+    """Normalises a scraped date ("July 4, 2025", ISO, "3 hours ago", ...) to DD-MM-YYYY, or None."""
+    text = DATE_PREFIX.sub("", clean_text(raw))
+    if pattern:
+        match = re.search(pattern, text)
+        text = match.group(0).strip() if match else ""
+    relative = RELATIVE_DATE.match(text)
+    if relative:
+        delta = timedelta(**{relative.group(2).lower() + "s": int(relative.group(1) or 1)})
+        return (reference_time() - delta).strftime(DATE_FORMAT)
+    if not YEAR.search(text):
+        return None  # dateutil would fill in today's date
+    try:
+        return date_parser.parse(text).strftime(DATE_FORMAT)
+    except (ValueError, OverflowError):
+        return None
+
+
+def _values(node, selectors):
+    """Cleaned text (or attribute, for "css@attr") of every match of each selector, in order."""
+    for selector in selectors:
+        css, _, attr = selector.partition("@")
+        for match in node.select(css):
+            value = clean_text(match.get(attr) if attr else match.text())
+            if value:
+                yield value
+
+
+def read_fields(node, fields, date_pattern=None):
+    """Reads the profile fields present under `node`; missing ones are left out."""
+    found = {}
+    title = next(_values(node, fields.title), None)
+    if title:
+        found["title"] = title
+    author = next(_values(node, fields.author), None)
+    if author:
+        found["author"] = author
+    for raw in _values(node, fields.date):
+        date = parse_date(raw, date_pattern)
+        if date:
+            found["publication_date"] = date
+            break
+    for css in fields.body:
+        container = node.select_one(css)
+        paragraphs = [clean_text(p.text()) for p in container.select("p")] if container else []
+        if any(paragraphs):
+            found["description"] = "\n".join(p for p in paragraphs if p)
+            break
+    return found
+
+
+def extract_article(profile, url, doc, teaser=None):
+    """Builds the article dict from a parsed page, filling gaps from the listing teaser."""
+    found = {**(teaser or {}), **read_fields(doc, profile.article, profile.date_pattern)}
+    return {
+        "source_url": url,
+        "title": found.get("title", ""),
+        "description": found.get("description", ""),
+        "author": found.get("author", UNKNOWN),
+        "publication_date": found.get("publication_date", UNKNOWN),
+    }
+
+
+def is_excluded(profile, article):
+    return any(re.search(pattern, article.get(field) or "", re.IGNORECASE) for field, pattern in profile.exclude.items())
+
+
+# ------------------- LINKS -------------------
+
+def article_url(profile, base_url, href):
+    """Absolute article URL for a link (as linked, not canonical), or None if the profile does not accept it."""
+    if not href:
+        return None
+    url = urljoin(base_url, href.strip())
+    if profile.strip_query:
+        url = url.split("?")[0]
+    if profile.url_pattern and not re.search(profile.url_pattern, url):
+        return None
+    return url
+
+
+def listing_links(profile, page_url, doc):
+    """Returns [(article URL, teaser fields)] from a parsed listing page, in page order, one per canonical URL."""
+    found = {}
+    for group in profile.links:
+        count = 0
+        for item in doc.select(group.items):
+            if group.limit is not None and count >= group.limit:
+                break
+            anchor = item.select_one(group.link) if group.link else item
+            url = article_url(profile, page_url, anchor.get("href") if anchor else None)
+            if url is None or canonical_url(url) in found:
+                continue
+            teaser = read_fields(item, group.teaser, profile.date_pattern) if group.teaser else None
+            found[canonical_url(url)] = (url, teaser)
+            count += 1
+    return list(found.values())
+
+
+def listing_page_url(listing_url, page):
+    return listing_url if page == 1 else urljoin(listing_url.rstrip("/") + "/", f"page/{page}/")
+
+
+def fetch_listings(profile, urls):
+    """Fetches listing pages; returns {url: html or None}. Browser sites render pages whose static HTML has no links."""
+    pages = fetch_pages(urls, headers=profile.headers)
+    html = {url: page.text if page.ok else None for url, page in pages.items()}
+    if profile.browser:
+        ready = ", ".join(group.css for group in profile.links)
+        missing = [url for url, text in html.items() if text is None or not parse_html(text).select_one(ready)]
+        if missing:
+            logger.info(f"[{profile.name}] Rendering {len(missing)} listing pages without server-rendered links")
+            html.update(get_browser_pool().render_pages(missing, **profile.listing_render))
+    return html
+
+
+def admit(frontier, fetch_urls, url, depth=0, data=None):
+    """Queues a linked URL under its canonical form, remembering the linked form to fetch."""
+    key = canonical_url(url)
+    if frontier.add(key, depth=depth, data=data):
+        fetch_urls[key] = url
+
+
+def collect_links(profile, frontier, seen_index, fetch_urls):
+    """Admits the listing pages' article links to the frontier, following pagination while pages have new links."""
+    active = list(profile.listing_urls)
+    for page in range(1, profile.pages + 1):
+        page_urls = {listing_page_url(listing_url, page): listing_url for listing_url in active}
+        html = fetch_listings(profile, page_urls)
+        active = []
+        for page_url, listing_url in page_urls.items():
+            if html.get(page_url) is None:
+                logger.error(f"[{profile.name}] Could not load listing {page_url}")
+                continue
+            links = listing_links(profile, page_url, parse_html(html[page_url]))
+            for url, teaser in links:
+                admit(frontier, fetch_urls, url, data=teaser)
+            fresh = sum(1 for url, _ in links if not seen_index.seen(canonical_url(url)))
+            logger.info(f"[{profile.name}] {len(links)} links on {page_url}, {fresh} new")
+            if fresh:
+                active.append(listing_url)
+
+
+# ------------------- ARTICLES -------------------
+
+def declared_url(profile, url, doc):
+    """The page's rel=canonical URL in canonical form, if it is an article URL on the same site."""
+    declared = article_url(profile, url, next(_values(doc, (CANONICAL_LINK,)), None))
+    return canonical_url(declared) if declared and same_site(declared, url) else None
+
+
+def fetch_articles(profile, urls, teasers):
+    """
+    Fetches and extracts articles. `urls` maps each canonical URL to the URL
+    to fetch. Returns ({url: article}, {url: followed links}) keyed by
+    canonical URL; failed URLs are absent. An article's `source_url` is the
+    page's rel=canonical when it declares one on the same site.
+    """
+    articles, followed = {}, {}
+    keys = {fetch_url: url for url, fetch_url in urls.items()}
+
+    def extract(fetch_url, html):
+        url = keys[fetch_url]
+        doc = parse_html(html, only=profile.article_targets)
+        if profile.follow:
+            followed[url] = [link for link in (article_url(profile, fetch_url, a.get("href")) for a in doc.select(profile.follow)) if link]
+        article = extract_article(profile, declared_url(profile, fetch_url, doc) or url, doc, teasers.get(url))
+        # Browser sites' structured-data tier, read from the same parse
+        return fill_from_json_ld(article, doc) if profile.browser else article
+
+    if profile.browser:
+        # Server-rendered HTML and structured data first; the browser only for what they miss
+        fetched = fetch_articles_static_first(
+            list(keys), extract, headers=profile.headers,
+            render=lambda missing: get_browser_pool().render_pages(missing, **profile.article_render),
+        )
+        for fetch_url, article in fetched.items():
+            if article["source_url"] == fetch_url:
+                article["source_url"] = keys[fetch_url]  # Filled from the WordPress API without a page parse
+            articles[keys[fetch_url]] = article
+        return articles, followed
+
+    for fetch_url, page in fetch_pages(list(keys), headers=profile.headers).items():
+        if not page.ok:
+            logger.error(f"[{profile.name}] Error fetching {fetch_url}: {page.error}")
+            continue
+        try:
+            articles[keys[fetch_url]] = extract(fetch_url, page.text)
+        except Exception as e:
+            logger.error(f"[{profile.name}] Error extracting {fetch_url}: {e}")
+    return articles, followed
+
+
+def scrape_site(profile):
+    """Scrapes one site end to end; returns the new articles submitted to the store."""
+    store = get_article_store()
+    seen_index = get_seen_index()
+
+    # Feeds and sitemaps already list every recent article, so nothing is crawled from them
+    feed_urls = discover_urls(profile.name, profile.feeds, url_filter=lambda url: article_url(profile, url, url) is not None)
+    frontier = CrawlFrontier(
+        max_depth=0 if feed_urls is not None else profile.max_depth,
+        max_urls=profile.max_articles,
+        journal=CrawlJournal(profile.name),
+    )
+    # Frontier, seen index and store use canonical URLs; pages are fetched as linked,
+    # which avoids a redirect per article (URLs resumed from the journal are fetched canonical)
+    fetch_urls = {}
+    if feed_urls is not None:
+        for url in feed_urls:
+            admit(frontier, fetch_urls, article_url(profile, url, url))
+    else:
+        collect_links(profile, frontier, seen_index, fetch_urls)
+
+    submitted = []
+    while frontier:
+        batch = frontier.pop_batch(FETCH_BATCH)
+        fresh = seen_index.claim(url for url, _, _ in batch)
+        fresh_set = set(fresh)
+        persisted = set()
+        try:
+            teasers = {url: data for url, _, data in batch if data}
+            articles, followed = fetch_articles(profile, {url: fetch_urls.get(url, url) for url in fresh}, teasers)
+
+            new_articles, unwanted = [], []
+            for url in fresh:
+                article = articles.get(url)
+                if article is None:
+                    continue
+                if article["source_url"] != url:
+                    unwanted.append(url)  # Stored under the page's rel=canonical instead
+                if article["title"] in MISSING and not article["description"]:
+                    logger.warning(f"[{profile.name}] Nothing extracted from {url}")
+                    unwanted.append(url)
+                elif is_excluded(profile, article):
+                    unwanted.append(url)
+                else:
+                    new_articles.append(article)
+            for url, depth, _ in batch:
+                for link in followed.get(url, ()):
+                    admit(frontier, fetch_urls, link, depth=depth + 1)
+
+            # Persist the batch before journaling it as done. Failed fetches are never journaled as done:
+            # an interrupted run retries them on resume; a completed run drops them with its journal
+            seen_index.mark(unwanted)
+            store.submit(new_articles)
+            store.flush()
+            persisted = fresh_set & set(articles)
+        finally:
+            # Claims last only until the page is stored; failed fetches can be claimed again next run
+            seen_index.release(fresh_set - persisted)
+        for url, _, _ in batch:
+            if url in articles or url not in fresh_set:
+                frontier.done(url)
+        submitted.extend(new_articles)
+        logger.info(f"[{profile.name}] {len(new_articles)} new articles from {len(fresh)} fetched ({len(batch) - len(fresh)} already seen)")
+
+    frontier.complete()
+    logger.info(f"[{profile.name}] Scraping completed: {len(submitted)} new articles")
+    return submitted
+
+
+# ------------------- ENTRY POINTS -------------------
+
+def all_hiphop_scraper():
+    return scrape_site(PROFILES["allhiphop"])
+
+
+def hiphopdx_scraper():
+    return scrape_site(PROFILES["hiphopdx"])
+
+
+def okayplayer_scraper():
+    return scrape_site(PROFILES["okayplayer"])
+
+
+def rapradar_scraper():
+    return scrape_site(PROFILES["rapradar"])
+
+
+def hotnew_hiphop():
+    return scrape_site(PROFILES["hotnewhiphop"])
+
+
+def hiphop_1987_scraper():
+    return scrape_site(PROFILES["hiphopsince1987"])
+
+
+def hiphophero_scraper():
+    return scrape_site(PROFILES["hiphophero"])
+
+
+def rap_up_scraper():
+    return scrape_site(PROFILES["rapup"])
@@ -0,0 +1,174 @@
+import html
+import json
+import logging
+import re
+from urllib.parse import urlsplit
+
+from dateutil import parser as date_parser
+
+from .fetch_engine import fetch_pages
+from .html_parser import parse_html
+
+
+# ------------------- CONFIGURATION -------------------
+
+ARTICLE_TYPES = {"Article", "NewsArticle", "BlogPosting", "ReportageNewsArticle", "AnalysisNewsArticle"}
+MISSING = {None, "", "N/A", "Unknown", "No title", "No title found"}  # Placeholders the scrapers emit
+DATE_FORMAT = "%d-%m-%Y"
+
+logger = logging.getLogger(__name__)
+
+
+def is_complete(article):
+    """True if the article has a title, a publication date and a body."""
+    return article is not None and all(
+        article.get(field) not in MISSING for field in ("title", "publication_date", "description")
+    )
+
+
+def _format_date(raw):
+    try:
+        return date_parser.parse(raw).strftime(DATE_FORMAT)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def _clean(text):
+    return re.sub(r"\s+", " ", html.unescape(text or "")).strip()
+
+
+# ------------------- JSON-LD -------------------
+
+def _flatten(data):
+    if isinstance(data, list):
+        for item in data:
+            yield from _flatten(item)
+    elif isinstance(data, dict):
+        yield data
+        yield from _flatten(data.get("@graph", []))
+
+
+def json_ld_article(doc):
+    """Returns the first Article-like JSON-LD object embedded in a parsed page, or None."""
+    for script in doc.select('script[type="application/ld+json"]'):
+        try:
+            data = json.loads(script.text())
+        except ValueError:
+            continue
+        for item in _flatten(data):
+            types = item.get("@type")
+            types = set(types) if isinstance(types, list) else {types}
+            if types & ARTICLE_TYPES:
+                return item
+    return None
+
+
+def _author_name(author):
+    if isinstance(author, list):
+        author = author[0] if author else None
+    if isinstance(author, dict):
+        author = author.get("name")
+    return _clean(author) if isinstance(author, str) else None
+
+
+def fill_from_json_ld(article, doc):
+    """Fills missing article fields from the page's JSON-LD; returns the article."""
+    data = json_ld_article(doc)
+    if not data:
+        return article
+    found = {
+        "title": _clean(data.get("headline") or data.get("name")),
+        "publication_date": _format_date(data.get("datePublished")),
+        "author": _author_name(data.get("author")),
+        "description": (data.get("articleBody") or "").strip(),
+    }
+    for field, value in found.items():
+        if article.get(field) in MISSING and value:
+            article[field] = value
+    return article
+
+
+# ------------------- WORDPRESS REST -------------------
+
+def wp_post_api_url(article_url):
+    """WordPress REST query for the post behind a pretty permalink."""
+    parts = urlsplit(article_url)
+    slug = parts.path.rstrip("/").rsplit("/", 1)[-1]
+    return f"{parts.scheme}://{parts.netloc}/wp-json/wp/v2/posts?slug={slug}&_embed=author"
+
+
+def fill_from_wp_post(article, post):
+    """Fills missing article fields from a WordPress REST post object; returns the article."""
+    authors = post.get("_embedded", {}).get("author") or []
+    content = parse_html(post.get("content", {}).get("rendered", ""))
+    found = {
+        "title": _clean(post.get("title", {}).get("rendered")),
+        "publication_date": _format_date(post.get("date")),
+        "author": _clean(authors[0].get("name")) if authors and isinstance(authors[0], dict) else None,
+        "description": "\n".join(p.text().strip() for p in content.select("p") if p.text().strip()),
+    }
+    for field, value in found.items():
+        if article.get(field) in MISSING and value:
+            article[field] = value
+    return article
+
+
+# ------------------- TIERED FETCH -------------------
+
+def fetch_articles_static_first(urls, extract, render, headers=None):
+    """
+    Scrapes articles with the browser as a last resort.
+
+    1. Plain HTTP fetch; `extract(url, html)` reads the page. It should fill
+       gaps from JSON-LD itself (fill_from_json_ld) on the document it
+       parsed, so each page is parsed once.
+    2. Articles still missing title, date or body: WordPress REST post JSON.
+    3. Still incomplete: `render(urls)` -> {url: html} in the browser, then extract.
+
+    Returns {url: article}; articles that fail every tier are left out.
+    """
+    articles = {}
+    for url, page in fetch_pages(urls, headers=headers).items():
+        if not page.ok:
+            continue
+        try:
+            article = extract(url, page.text)
+            if article is not None:
+                articles[url] = article
+        except Exception as e:
+            logger.warning(f"Static extraction failed for {url}: {e}")
+
+    incomplete = [url for url in urls if not is_complete(articles.get(url))]
+    if incomplete:
+        api_urls = {url: wp_post_api_url(url) for url in incomplete}
+        responses = fetch_pages(api_urls.values(), headers=headers)
+        for url, api_url in api_urls.items():
+            response = responses[api_url]
+            try:
+                posts = json.loads(response.text) if response.ok else []
+            except ValueError:
+                posts = []
+            if posts and isinstance(posts, list):
+                article = articles.get(url) or {
+                    "source_url": url, "title": None, "description": "", "author": "Unknown", "publication_date": "Unknown",
+                }
+                articles[url] = fill_from_wp_post(article, posts[0])
+
+    static_hits = sum(1 for url in urls if is_complete(articles.get(url)))
+    fallback = [url for url in urls if not is_complete(articles.get(url))]
+    logger.info(f"Static fetch completed {static_hits}/{len(urls)} articles; {len(fallback)} need the browser")
+
+    for url, html_text in (render(fallback) if fallback else {}).items():
+        if html_text is None:
+            continue
+        try:
+            article = extract(url, html_text)
+            if article is not None:
+                # Keep whatever the static tiers found for fields the browser also missed
+                merged = dict(articles.get(url) or article)
+                merged.update((field, value) for field, value in article.items() if value not in MISSING)
+                articles[url] = merged
+        except Exception as e:
+            logger.warning(f"Rendered extraction failed for {url}: {e}")
+
+    return {url: articles[url] for url in urls if url in articles}
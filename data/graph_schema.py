@@ -0,0 +1,93 @@
+# data/graph_schema.py
+import logging
+import threading
+
+from neo4j import GraphDatabase
+from neo4j.exceptions import Neo4jError
+
+from configuration import NEO4J_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# Keys the uploader MERGEs on. A uniqueness constraint also gives the key an
+# index, so each MERGE is an index lookup instead of a label scan.
+UNIQUE_KEYS = [
+    ("article_title", "Article", "title"),
+    ("author_name", "Author", "name"),
+    ("url_url", "URL", "url"),
+]
+
+# Properties the LLM-generated Cypher filters and sorts on
+RANGE_INDEXES = [
+    ("article_publication_date", "Article", "publication_date"),
+]
+
+_bootstrapped = False
+_bootstrap_lock = threading.Lock()
+
+
+def _create(session, statement):
+    session.run(statement).consume()
+
+
+def create_schema(session):
+    """
+    Idempotently creates the constraints and indexes. A constraint that
+    cannot be created (existing duplicate nodes) falls back to a plain
+    range index on the key. Returns the names of what could not be created.
+    """
+    failed = []
+    for name, label, key in UNIQUE_KEYS:
+        try:
+            _create(session, f"CREATE CONSTRAINT {name} IF NOT EXISTS FOR (n:{label}) REQUIRE n.{key} IS UNIQUE")
+        except Neo4jError as e:
+            logger.error(f"[Neo4j] Cannot create uniqueness constraint on :{label}({key}), indexing it instead: {e}")
+            try:
+                _create(session, f"CREATE RANGE INDEX {name}_index IF NOT EXISTS FOR (n:{label}) ON (n.{key})")
+            except Neo4jError as e:
+                logger.error(f"[Neo4j] Cannot create index on :{label}({key}): {e}")
+                failed.append(name)
+    for name, label, key in RANGE_INDEXES:
+        try:
+            _create(session, f"CREATE RANGE INDEX {name} IF NOT EXISTS FOR (n:{label}) ON (n.{key})")
+        except Neo4jError as e:
+            logger.error(f"[Neo4j] Cannot create index on :{label}({key}): {e}")
+            failed.append(name)
+    return failed
+
+
+def ensure_schema(driver=None):
+    """
+    Bootstraps the graph schema once per process; later calls return at once.
+    Uses `driver` if given, otherwise opens one from NEO4J_CONFIG. Errors are
+    logged, not raised, and a failed bootstrap is retried on the next call.
+    """
+    global _bootstrapped
+    with _bootstrap_lock:
+        if _bootstrapped:
+            return True
+        own_driver = driver is None
+        try:
+            if own_driver:
+                driver = GraphDatabase.driver(
+                    NEO4J_CONFIG["uri"],
+                    auth=(NEO4J_CONFIG["username"], NEO4J_CONFIG["password"])
+                )
+            with driver.session(database=NEO4J_CONFIG.get("database")) as session:
+                failed = create_schema(session)
+            _bootstrapped = not failed
+            if _bootstrapped:
+                logger.info("[Neo4j] Schema constraints and indexes in place.")
+        except Exception as e:
+            logger.error(f"[Neo4j] Schema bootstrap failed: {e}")
+        finally:
+            if own_driver and driver is not None:
+                driver.close()
+        return _bootstrapped
+
+
+def ensure_schema_in_background():
+    """Runs ensure_schema() on a daemon thread, so a slow database never delays startup."""
+    thread = threading.Thread(target=ensure_schema, name="neo4j-schema-bootstrap", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,147 @@
+# llm/embedding_cache.py
+"""
+Persistent, content-addressed embedding cache.
+
+A vector is stored under sha256(model, task type, text) as packed float32
+in SQLite, about 3 KB for a 768-dimension embedding. The same text
+embedded again, whether on a pipeline re-run, a backfill or a repeated
+query, is served from disk instead of the API. The least recently used
+entries are evicted once the cache passes EMBEDDING_CACHE_MAX_MB.
+"""
+import hashlib
+import logging
+import os
+import threading
+import time
+from array import array
+from pathlib import Path
+
+from utils.sqlite_store import LruStore
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE = Path(os.getenv(
+    "EMBEDDING_CACHE_FILE",
+    Path(__file__).resolve().parent.parent / "daily_news_pipeline" / "news_scrapers" / "news_articles_data" / "embedding_cache.db",
+))
+ENABLED = os.getenv("EMBEDDING_CACHE", "1") != "0"
+MAX_BYTES = int(float(os.getenv("EMBEDDING_CACHE_MAX_MB", "500")) * 1024 * 1024)
+LOOKUP_CHUNK = 500      # Keys per SELECT ... IN (...)
+QUERY_TASK_TYPE = "RETRIEVAL_QUERY"  # embed_query's task type; the uploader embeds chunks with it too
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    key BLOB PRIMARY KEY,
+    vector BLOB NOT NULL,
+    last_used REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings (last_used);
+"""
+
+
+def cache_key(model, text, task_type=None):
+    return hashlib.sha256(f"{model}\0{task_type or ''}\0{text}".encode("utf-8")).digest()
+
+
+def _pack(vector):
+    return array("f", vector).tobytes()
+
+
+def _unpack(blob):
+    return array("f", blob).tolist()
+
+
+class EmbeddingCache(LruStore):
+    """SQLite store of float32 vectors keyed by cache_key()."""
+
+    SCHEMA = SCHEMA
+    SYNCHRONOUS = "NORMAL"
+    TABLE, KEY, SIZE, SIZED_COLUMNS = "embeddings", "key", "length({row}.vector)", ("vector",)
+    NAME = "Embedding cache"
+
+    def __init__(self, path=CACHE_FILE, max_bytes=MAX_BYTES):
+        self._lock = threading.Lock()
+        self._stats = {"lookups": 0, "hits": 0, "stores": 0, "evicted": 0}
+        super().__init__(path, max_bytes)
+
+    def _count(self, **increments):
+        with self._lock:
+            for key, value in increments.items():
+                self._stats[key] += value
+
+    def get_many(self, model, texts, task_type=None):
+        """Returns a list aligned with `texts`: the cached vector, or None on a miss."""
+        keys = [cache_key(model, text, task_type) for text in texts]
+        found = {}
+        conn = self._connection()
+        for i in range(0, len(keys), LOOKUP_CHUNK):
+            chunk = list(set(keys[i:i + LOOKUP_CHUNK]))
+            rows = conn.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({', '.join('?' * len(chunk))})", chunk
+            ).fetchall()
+            found.update(rows)
+        if found:
+            with conn:
+                conn.executemany("UPDATE embeddings SET last_used = ? WHERE key = ?", [(time.time(), key) for key in found])
+        self._count(lookups=len(keys), hits=sum(1 for key in keys if key in found))
+        return [_unpack(found[key]) if key in found else None for key in keys]
+
+    def put_many(self, model, texts, vectors, task_type=None):
+        """Stores vectors for texts (None vectors are skipped); evicts if over budget."""
+        now = time.time()
+        rows = [(cache_key(model, text, task_type), _pack(vector), now) for text, vector in zip(texts, vectors) if vector is not None]
+        with self._connection() as conn:
+            conn.executemany(
+                "INSERT INTO embeddings (key, vector, last_used) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET vector = excluded.vector, last_used = excluded.last_used",
+                rows,
+            )
+        self._count(stores=len(rows), evicted=self._evict())
+
+    def get(self, model, text, task_type=None):
+        return self.get_many(model, [text], task_type)[0]
+
+    def put(self, model, text, vector, task_type=None):
+        self.put_many(model, [text], [vector], task_type)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        stats["hit_rate"] = stats["hits"] / stats["lookups"] if stats["lookups"] else 0.0
+        return stats
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache():
+    """Returns the process-wide embedding cache, or None when disabled with EMBEDDING_CACHE=0."""
+    global _cache
+    if not ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = EmbeddingCache()
+        return _cache
+
+
+class CachedEmbeddings:
+    """Wraps an embeddings client so embed_query() consults the cache first."""
+
+    def __init__(self, embeddings, cache=None):
+        self.embeddings = embeddings
+        self.cache = cache
+        self.model = getattr(embeddings, "model", type(embeddings).__name__)
+
+    def embed_query(self, text):
+        cache = self.cache or get_embedding_cache()
+        vector = cache.get(self.model, text, QUERY_TASK_TYPE) if cache else None
+        if vector is None:
+            vector = self.embeddings.embed_query(text)
+            if cache:
+                cache.put(self.model, text, vector, QUERY_TASK_TYPE)
+        return vector
+
+    def __getattr__(self, name):
+        return getattr(self.embeddings, name)
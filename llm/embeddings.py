@@ -1,12 +1,14 @@
 # llm/embeddings.py
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
+from llm.embedding_cache import CachedEmbeddings
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
 def get_embeddings():
-    return GoogleGenerativeAIEmbeddings(
+    # Repeated queries are answered from the embedding cache
+    return CachedEmbeddings(GoogleGenerativeAIEmbeddings(
         model="models/text-embedding-004",
         google_api_key=os.getenv("GOOGLE_API_KEY")
-    )
+    ))
@@ -1,9 +1,17 @@
 # main.py
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from api.routes import router
+from data.graph_schema import ensure_schema_in_background
 
-app = FastAPI(title="Music News RAG API")
+@asynccontextmanager
+async def lifespan(app):
+    # Constraints and indexes for the graph keys; off the startup path
+    ensure_schema_in_background()
+    yield
+
+app = FastAPI(title="Music News RAG API", lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"], allow_methods=["*"], allow_headers=["*"]
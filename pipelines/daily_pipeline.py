@@ -1,9 +1,7 @@
 # pipelines/daily_pipeline.py
 
-import os
-import json
 import logging
-from datetime import datetime
+from datetime import date
 
 from daily_news_pipeline import (
     all_hiphop_scraper,
@@ -16,22 +14,31 @@ from daily_news_pipeline import (
     rap_up_scraper
 )
 from daily_news_pipeline.data_uploder.articles_uploder import upload_to_neo4j, embed_and_upsert
+from daily_news_pipeline.data_uploder.near_duplicates import mark_duplicates
+from daily_news_pipeline.news_scrapers.article_store import get_article_store
+from daily_news_pipeline.news_scrapers.browser_pool import open_browser_pool, shutdown_browser_pool
+from daily_news_pipeline.news_scrapers.http_cache import get_http_cache
+from pipelines.scraper_runner import run_scrapers
+from configuration import PIPELINE_CONFIG
 
 logger = logging.getLogger(__name__)
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-OUTPUT_FILE = os.path.normpath(os.path.join(
-    BASE_DIR,
-    "..",
-    "daily_news_pipeline",
-    "news_scrapers",
-    "news_articles_data",
-    "news_articles_scrap_data.json"
-))
+
+SCRAPERS = {
+    "allhiphop": all_hiphop_scraper,
+    "hiphopdx": hiphopdx_scraper,
+    "okayplayer": okayplayer_scraper,
+    "rapradar": rapradar_scraper,
+    "hotnewhiphop": hotnew_hiphop,
+    "hiphopsince1987": hiphop_1987_scraper,
+    "hiphophero": hiphophero_scraper,
+    "rapup": rap_up_scraper,
+}
 
 def run_full_pipeline():
     """
     Executes the daily pipeline:
-    - Scrapes news articles from multiple hip-hop news sites.
+    - Scrapes news articles from multiple hip-hop news sites in parallel.
+    - Links near-duplicate articles to a canonical copy.
     - Uploads data to Neo4j.
     - Embeds and stores in Pinecone.
     """
@@ -39,50 +46,61 @@ def run_full_pipeline():
     try:
         logger.info("Starting daily scraping and upload pipeline")
 
-        # Run all scrapers
-        all_hiphop_scraper()
-        hiphopdx_scraper()
-        okayplayer_scraper()
-        rapradar_scraper()
-        hotnew_hiphop()
-        hiphop_1987_scraper()
-        hiphophero_scraper()
-        rap_up_scraper()
-
-        logger.info("All scrapers completed successfully.")
-
-        # Load scraped data
-        if not os.path.exists(OUTPUT_FILE):
-            logger.error(f"Data file not found: {OUTPUT_FILE}")
-            return {"status": "error", "message": "Data file not found."}
-
-        with open(OUTPUT_FILE, "r", encoding="utf-8") as f:
-            all_articles = json.load(f)
-
-        logger.info(f"Loaded {len(all_articles)} total articles from {OUTPUT_FILE}")
-
-        # Filter today's articles
-        today_str = datetime.today().strftime("%d-%m-%Y")
-        today_articles = [
-            article for article in all_articles
-            if article.get("publication_date", "").strip() == today_str
-        ]
+        # Run all scrapers concurrently
+        open_browser_pool()
+        try:
+            scraper_results = run_scrapers(
+                SCRAPERS,
+                max_workers=PIPELINE_CONFIG["scraper_workers"],
+                timeout=PIPELINE_CONFIG["scraper_timeout"]
+            )
+        finally:
+            # The Playwright scrapers share one browser for the run; scrapers abandoned
+            # after a timeout cannot start another once it is shut down
+            shutdown_browser_pool()
+        scraper_status = {result.name: result.status for result in scraper_results}
+        failed = [name for name, status in scraper_status.items() if status != "success"]
+        if failed:
+            logger.warning(f"Scrapers failed or timed out: {', '.join(failed)}")
+        logger.info(f"Scrapers completed: {len(scraper_results) - len(failed)}/{len(scraper_results)} succeeded.")
+        if get_http_cache():
+            get_http_cache().log_stats()
+
+        # Wait for the article store to commit everything the scrapers queued
+        store = get_article_store()
+        store.flush()
+
+        # Today's articles, via the publication date index
+        today = date.today()
+        today_articles = store.articles_published_on(today)
 
         if not today_articles:
             logger.warning("No articles found for today's date.")
-            return {"status": "no articles", "count": 0}
+            return {"status": "no articles", "count": 0, "scrapers": scraper_status}
+
+        logger.info(f"Found {len(today_articles)} articles for {today.isoformat()}")
 
-        logger.info(f"Found {len(today_articles)} articles for {today_str}")
+        # Drop placeholder bodies and link syndicated copies to their canonical article
+        today_articles = mark_duplicates(today_articles)
 
         # Upload to Neo4j
-        upload_to_neo4j(today_articles)
-        logger.info("Uploaded articles to Neo4j successfully.")
+        neo4j_report = upload_to_neo4j(today_articles)
+        if neo4j_report["failed"]:
+            logger.warning(f"{len(neo4j_report['failed'])} articles could not be uploaded to Neo4j.")
+        logger.info(f"Uploaded {neo4j_report['uploaded']} articles to Neo4j ({neo4j_report['skipped']} unchanged).")
 
         # Upload to Pinecone
-        embed_and_upsert(today_articles)
+        pinecone_report = embed_and_upsert(today_articles)
+        if pinecone_report and pinecone_report["failed"]:
+            logger.warning(f"{pinecone_report['failed']} chunk vectors could not be upserted to Pinecone.")
         logger.info("Embedded and upserted articles to Pinecone successfully.")
 
-        return {"status": "success", "count": len(today_articles)}
+        return {
+            "status": "success",
+            "count": len(today_articles),
+            "neo4j_failed": neo4j_report["failed"],
+            "scrapers": scraper_status,
+        }
 
     except Exception as e:
         logger.exception("Pipeline execution failed")
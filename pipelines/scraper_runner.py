@@ -0,0 +1,71 @@
+# pipelines/scraper_runner.py
+
+import logging
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+POLL_INTERVAL = 1.0  # seconds between timeout checks
+
+
+@dataclass
+class ScraperResult:
+    """Outcome of one scraper run: status is "success", "error" or "timeout"."""
+    name: str
+    status: str
+    result: Any = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+
+def run_scrapers(scrapers: Dict[str, Callable[[], Any]], max_workers: int = 8, timeout: float = 900) -> List[ScraperResult]:
+    """
+    Runs every scraper concurrently in a thread pool.
+
+    - `timeout` applies to each scraper from the moment it starts running.
+    - Exceptions are captured per scraper and never abort the others.
+    - A scraper that times out is reported and abandoned; its thread is left
+      to finish on its own since Python threads cannot be killed.
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scraper")
+    started_at = {}
+
+    def _run(name, scraper):
+        started_at[name] = time.monotonic()
+        logger.info(f"[{name}] Scraper started")
+        return scraper()
+
+    futures = {executor.submit(_run, name, scraper): name for name, scraper in scrapers.items()}
+    results = {}
+    pending = set(futures)
+
+    try:
+        while pending:
+            done, pending = wait(pending, timeout=POLL_INTERVAL, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                name = futures[future]
+                elapsed = time.monotonic() - started_at.get(name, time.monotonic())
+                try:
+                    results[name] = ScraperResult(name, "success", result=future.result(), elapsed=elapsed)
+                    logger.info(f"[{name}] Scraper finished in {elapsed:.1f}s")
+                except Exception as e:
+                    results[name] = ScraperResult(name, "error", error=f"{type(e).__name__}: {e}", elapsed=elapsed)
+                    logger.error(f"[{name}] Scraper failed after {elapsed:.1f}s: {e}\n{traceback.format_exc()}")
+
+            now = time.monotonic()
+            for future in list(pending):
+                name = futures[future]
+                if name in started_at and now - started_at[name] > timeout:
+                    pending.discard(future)
+                    future.cancel()
+                    results[name] = ScraperResult(name, "timeout", error=f"Timed out after {timeout}s", elapsed=now - started_at[name])
+                    logger.error(f"[{name}] Scraper timed out after {timeout}s")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return [results[name] for name in scrapers]
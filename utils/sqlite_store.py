@@ -0,0 +1,105 @@
+# utils/sqlite_store.py
+"""
+Shared plumbing for the SQLite files the pipeline keeps next to its data.
+
+SQLiteStore gives each thread its own connection in WAL mode and applies
+the subclass's SCHEMA once. LruStore adds a byte budget. The total size of
+the table is tracked in a `store_bytes` row, which triggers update in the
+same transaction as every insert, update and delete. Checking the budget is
+therefore one indexed read. The LRU scan runs only when the total is over.
+"""
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+EVICT_TO = 0.9  # Eviction trims a store to this fraction of its budget
+
+
+class SQLiteStore:
+    """Per-thread SQLite connections (WAL) to one file, with SCHEMA applied on open."""
+
+    SCHEMA = ""
+    SYNCHRONOUS = None  # e.g. "NORMAL" for caches that can lose their last writes
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.executescript(self.SCHEMA)
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            if self.SYNCHRONOUS:
+                conn.execute(f"PRAGMA synchronous={self.SYNCHRONOUS}")
+            self._local.conn = conn
+        return conn
+
+
+class LruStore(SQLiteStore):
+    """
+    An SQLiteStore whose TABLE is kept under `max_bytes`, least recently used
+    rows first. Subclasses set TABLE, KEY (its primary key), SIZE (the SQL
+    size of a row, with "{row}" where the row alias goes) and SIZED_COLUMNS
+    (the columns SIZE reads). The table needs a `last_used` column.
+    """
+
+    TABLE = KEY = SIZE = ""
+    SIZED_COLUMNS = ()
+    NAME = "Store"  # For log messages
+
+    def __init__(self, path, max_bytes):
+        super().__init__(path)
+        self.max_bytes = max_bytes
+        size = {row: self.SIZE.format(row=row) for row in ("NEW", "OLD")}
+        with self._connection() as conn:
+            conn.executescript(f"""
+                CREATE TABLE IF NOT EXISTS store_bytes (tbl TEXT PRIMARY KEY, total INTEGER NOT NULL);
+                CREATE TRIGGER IF NOT EXISTS {self.TABLE}_bytes_insert AFTER INSERT ON {self.TABLE} BEGIN
+                    UPDATE store_bytes SET total = total + {size["NEW"]} WHERE tbl = '{self.TABLE}';
+                END;
+                CREATE TRIGGER IF NOT EXISTS {self.TABLE}_bytes_delete AFTER DELETE ON {self.TABLE} BEGIN
+                    UPDATE store_bytes SET total = total - {size["OLD"]} WHERE tbl = '{self.TABLE}';
+                END;
+                CREATE TRIGGER IF NOT EXISTS {self.TABLE}_bytes_update AFTER UPDATE OF {", ".join(self.SIZED_COLUMNS)} ON {self.TABLE} BEGIN
+                    UPDATE store_bytes SET total = total + {size["NEW"]} - {size["OLD"]} WHERE tbl = '{self.TABLE}';
+                END;
+            """)
+            # Files written before the total was tracked are summed once
+            if conn.execute("SELECT 1 FROM store_bytes WHERE tbl = ?", (self.TABLE,)).fetchone() is None:
+                conn.execute(
+                    f"INSERT INTO store_bytes (tbl, total) "
+                    f"SELECT ?, COALESCE(SUM({self.SIZE.format(row=self.TABLE)}), 0) FROM {self.TABLE}",
+                    (self.TABLE,),
+                )
+
+    def size(self):
+        """Total bytes stored, as tracked by the triggers."""
+        row = self._connection().execute("SELECT total FROM store_bytes WHERE tbl = ?", (self.TABLE,)).fetchone()
+        return row[0] if row else 0
+
+    def _evict(self):
+        """Deletes least recently used rows down to EVICT_TO of the budget once it is exceeded; returns how many."""
+        total = self.size()
+        if total <= self.max_bytes:
+            return 0
+        target = int(self.max_bytes * EVICT_TO)
+        conn = self._connection()
+        keys = []
+        for key, stored_size in conn.execute(
+            f"SELECT {self.KEY}, {self.SIZE.format(row=self.TABLE)} FROM {self.TABLE} ORDER BY last_used"
+        ):
+            if total <= target:
+                break
+            keys.append((key,))
+            total -= stored_size
+        with conn:
+            conn.executemany(f"DELETE FROM {self.TABLE} WHERE {self.KEY} = ?", keys)
+        logger.info(f"{self.NAME} evicted {len(keys)} entries, {total / 1024 / 1024:.1f} MB kept")
+        return len(keys)